@@ -3,28 +3,36 @@
 
 from __future__ import annotations
 
-import fnmatch
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 from command_argv import display_argv, execute_argv, validate_argv
 from common import (
     CommandError,
-    branch_exists,
     branch_name_for,
     checkout_restore,
-    commit_with_message,
-    delete_branch,
+    commit_staged,
+    compile_globs,
     diff_name_status,
+    diff_name_status_z,
     diff_stat,
     ensure_branches_exist,
     ensure_clean_tree,
     ensure_git_repo,
     git,
-    unique_temp_branch,
+    local_branch_names,
+    pathspec_file,
+    repo_root,
+    resolve_objects,
 )
 from metadata import ChangesetMetadata, stamp_commit_message
 from patch_apply import (
+    DiffFile,
+    HunkSelector,
     apply_patch_file,
     apply_patch_text,
     build_diff,
@@ -33,59 +41,69 @@ from patch_apply import (
 )
 
 
-@dataclass
-class DiffEntry:
+class DiffEntry(NamedTuple):
+    """One name-status diff record; a NamedTuple keeps parsing allocation-light."""
+
     status: str
     path: str
     old_path: Optional[str] = None
 
 
-def _matches_any(path: str, patterns: Iterable[str]) -> bool:
-    return any(fnmatch.fnmatch(path, pat) for pat in patterns)
-
-
 def changed_files_between(base: str, source: str) -> List[DiffEntry]:
-    raw = diff_name_status(base, source)
+    raw = diff_name_status_z(base, source)
     entries: List[DiffEntry] = []
     if not raw:
         return entries
 
-    for line in raw.splitlines():
-        parts = line.split("\t")
-        if not parts:
+    # -z records are "STATUS\0path\0", or "STATUS\0old\0new\0" for renames
+    # and copies, so one split gives every token without per-line parsing
+    # (and without mangling paths that contain tabs or newlines).
+    tokens = raw.split("\0")
+    total = len(tokens)
+    i = 0
+    while i < total:
+        status = tokens[i]
+        if not status:
+            i += 1
             continue
-        status = parts[0]
         code = status[0]
-        if code == "R" and len(parts) >= 3:
-            entries.append(DiffEntry(status=code, path=parts[2], old_path=parts[1]))
-        elif len(parts) >= 2:
-            entries.append(DiffEntry(status=code, path=parts[1]))
+        if code in ("R", "C") and i + 2 < total:
+            entries.append(
+                DiffEntry(status=code, path=tokens[i + 2], old_path=tokens[i + 1])
+            )
+            i += 3
+        elif i + 1 < total:
+            entries.append(DiffEntry(status=code, path=tokens[i + 1]))
+            i += 2
+        else:
+            break
     return entries
 
 
 def select_entries(
     entries: Sequence[DiffEntry], include: Sequence[str], exclude: Sequence[str]
 ) -> List[DiffEntry]:
-    if not include:
+    # Hoist the compiled matchers and apply both filters in one pass, so an
+    # empty exclude list costs nothing and no intermediate list is built.
+    include_re = compile_globs(tuple(include))
+    if include_re is None:
         return []
+    exclude_re = compile_globs(tuple(exclude))
 
-    selected = [
-        e
-        for e in entries
-        if _matches_any(e.path, include)
-        or (e.old_path and _matches_any(e.old_path, include))
-    ]
-    if not exclude:
-        return selected
-
-    filtered: List[DiffEntry] = []
-    for e in selected:
-        if _matches_any(e.path, exclude):
+    selected: List[DiffEntry] = []
+    for e in entries:
+        if not (
+            include_re.match(e.path)
+            or (e.old_path and include_re.match(e.old_path))
+        ):
             continue
-        if e.old_path and _matches_any(e.old_path, exclude):
+        if exclude_re is not None and (
+            exclude_re.match(e.path)
+            or (e.old_path and exclude_re.match(e.old_path))
+        ):
             continue
-        filtered.append(e)
-    return filtered
+        selected.append(e)
+    return selected
 
 
 @dataclass
@@ -94,9 +112,85 @@ class ApplySummary:
     message: str
 
 
+def _source_index_entries(base: str, source: str) -> Dict[str, Tuple[str, str]]:
+    """Map each changed path to its (mode, oid) in source via one diff-tree call."""
+    raw = git("diff-tree", "-r", "-z", "--raw", base, source).stdout
+    entries: Dict[str, Tuple[str, str]] = {}
+    tokens = raw.split("\0")
+    total = len(tokens)
+    i = 0
+    while i + 1 < total:
+        meta = tokens[i]
+        if not meta.startswith(":"):
+            i += 1
+            continue
+        # ":oldmode newmode oldsha newsha STATUS\0path\0" per record.
+        fields = meta[1:].split(" ")
+        if len(fields) < 5:
+            i += 1
+            continue
+        new_mode, new_sha, status = fields[1], fields[3], fields[4]
+        path = tokens[i + 1]
+        i += 2
+        if status[0] in ("R", "C") and i < total:
+            path = tokens[i]
+            i += 1
+        if status[0] != "D":
+            entries[path] = (new_mode, new_sha)
+    return entries
+
+
+def _stage_paths_from_source(
+    *, base_branch: str, source_branch: str, paths: Sequence[str]
+) -> None:
+    """Stage source-branch contents for paths without re-hashing the worktree.
+
+    ``git update-index --index-info`` writes the exact (mode, oid) pairs into
+    the index straight from diff-tree metadata, and ``git checkout-index -u``
+    materializes the worktree copies with fresh stat information, so no blob
+    is hashed twice.
+    """
+    index_entries = _source_index_entries(base_branch, source_branch)
+    missing = [path for path in paths if path not in index_entries]
+    if missing:
+        # Defensive: a path selected from the porcelain diff should always be
+        # present in the plumbing diff; fall back to a batched checkout.
+        with pathspec_file(missing) as spec:
+            git(
+                "checkout",
+                source_branch,
+                f"--pathspec-from-file={spec}",
+                "--pathspec-file-nul",
+            )
+    records = [
+        "{0} {1}\t{2}".format(*index_entries[path], path)
+        for path in paths
+        if path in index_entries
+    ]
+    if not records:
+        return
+    git(
+        "update-index",
+        "--add",
+        "--replace",
+        "-z",
+        "--index-info",
+        input="\0".join(records) + "\0",
+    )
+    git(
+        "checkout-index",
+        "-u",
+        "-f",
+        "-z",
+        "--stdin",
+        input="\0".join(p for p in paths if p in index_entries) + "\0",
+    )
+
+
 def _commit_changeset(
     *, source_branch: str, source_sha: str, index: int, changeset: Dict
-) -> None:
+) -> bool:
+    """Commit the staged changeset; return False when nothing was staged."""
     commit_message = changeset.get("commit_message")
     slug = str(changeset.get("slug", f"cs-{index}")).strip() or f"cs-{index}"
     if not isinstance(commit_message, str) or not commit_message.strip():
@@ -110,21 +204,23 @@ def _commit_changeset(
             source_sha=source_sha,
         ),
     )
-    commit_with_message(stamped)
+    return commit_staged(stamped)
 
 
 def _apply_changeset_paths(
     *,
-    base_branch: str,
+    base_sha: str,
     source_branch: str,
     source_sha: str,
     index: int,
     changeset: Dict,
+    diff_entries: Optional[List[DiffEntry]] = None,
 ) -> ApplySummary:
     include = changeset.get("include_paths", [])
     exclude = changeset.get("exclude_paths", [])
 
-    diff_entries = changed_files_between(base_branch, source_branch)
+    if diff_entries is None:
+        diff_entries = changed_files_between(base_sha, source_sha)
     selected = select_entries(diff_entries, include, exclude)
 
     if not selected:
@@ -146,31 +242,35 @@ def _apply_changeset_paths(
             delete_paths.append(entry.old_path)
         checkout_paths.append(entry.path)
 
-    for path in checkout_paths:
-        git("checkout", source_branch, "--", path)
-
-    for path in delete_paths:
-        git("rm", "-f", "--ignore-unmatch", path)
+    if checkout_paths:
+        _stage_paths_from_source(
+            base_branch=base_sha,
+            source_branch=source_sha,
+            paths=checkout_paths,
+        )
 
-    git("add", "-A")
-    git("reset", "-q", "--", ".carve-changesets")
+    if delete_paths:
+        with pathspec_file(delete_paths) as spec:
+            git(
+                "rm",
+                "-f",
+                "--ignore-unmatch",
+                f"--pathspec-from-file={spec}",
+                "--pathspec-file-nul",
+            )
 
-    diff_cached = git("diff", "--cached", "--quiet", check=False)
-    if diff_cached.returncode == 0:
-        print(f"[WARN] Changeset {index}: no staged changes after apply.")
-        return ApplySummary(
-            mode="paths",
-            message=(
-                f"{len(checkout_paths)} paths checked out, {len(delete_paths)} paths removed"
-            ),
-        )
+    # The index already matches the changeset exactly: checkout paths were
+    # staged via update-index and deletions via git rm, so a full-worktree
+    # `git add -A` rescan (O(repo), not O(changeset)) adds nothing — and
+    # without it .carve-changesets/ can never be swept into the commit.
 
-    _commit_changeset(
+    if not _commit_changeset(
         source_branch=source_branch,
         source_sha=source_sha,
         index=index,
         changeset=changeset,
-    )
+    ):
+        print(f"[WARN] Changeset {index}: no staged changes after apply.")
     return ApplySummary(
         mode="paths",
         message=(
@@ -192,38 +292,40 @@ def _apply_changeset_patch(
         raise CommandError(f"{label}: patch_file must be a non-empty string.")
     apply_patch_file(patch_file, label=label)
 
-    diff_cached = git("diff", "--cached", "--quiet", check=False)
-    if diff_cached.returncode == 0:
-        print(f"[WARN] Changeset {index}: no staged changes after apply.")
-        return ApplySummary(
-            mode="patch", message="patch applied with no staged changes"
-        )
-
-    _commit_changeset(
+    if not _commit_changeset(
         source_branch=source_branch,
         source_sha=source_sha,
         index=index,
         changeset=changeset,
-    )
+    ):
+        print(f"[WARN] Changeset {index}: no staged changes after apply.")
+        return ApplySummary(
+            mode="patch", message="patch applied with no staged changes"
+        )
     return ApplySummary(mode="patch", message="patch applied and committed")
 
 
 def _apply_changeset_hunks(
     *,
-    base_branch: str,
+    base_sha: str,
     source_branch: str,
     source_sha: str,
     index: int,
     changeset: Dict,
     label: str,
+    diff_files: Optional[List[DiffFile]] = None,
+    parsed_selectors: Optional[List[HunkSelector]] = None,
 ) -> ApplySummary:
-    selectors = changeset.get("hunk_selectors", [])
     include = changeset.get("include_paths", [])
     exclude = changeset.get("exclude_paths", [])
     allow_partial = changeset.get("allow_partial_files", True)
 
-    parsed = parse_hunk_selectors(selectors, changeset_label=label)
-    diff_files = build_diff(base_branch, source_branch)
+    parsed = parsed_selectors
+    if parsed is None:
+        selectors = changeset.get("hunk_selectors", [])
+        parsed = parse_hunk_selectors(selectors, changeset_label=label)
+    if diff_files is None:
+        diff_files = build_diff(base_sha, source_sha)
     selected = select_hunks_for_changeset(
         diff_files,
         parsed,
@@ -234,20 +336,13 @@ def _apply_changeset_hunks(
     )
     apply_patch_text(selected.text, label=label)
 
-    diff_cached = git("diff", "--cached", "--quiet", check=False)
-    if diff_cached.returncode == 0:
-        print(f"[WARN] Changeset {index}: no staged changes after apply.")
-        return ApplySummary(
-            mode="hunks",
-            message=f"{selected.hunks} hunks selected in {selected.files} files",
-        )
-
-    _commit_changeset(
+    if not _commit_changeset(
         source_branch=source_branch,
         source_sha=source_sha,
         index=index,
         changeset=changeset,
-    )
+    ):
+        print(f"[WARN] Changeset {index}: no staged changes after apply.")
     return ApplySummary(
         mode="hunks",
         message=f"{selected.hunks} hunks selected in {selected.files} files",
@@ -261,16 +356,31 @@ def apply_changeset(
     source_sha: str,
     index: int,
     changeset: Dict,
+    base_sha: Optional[str] = None,
+    diff_entries: Optional[List[DiffEntry]] = None,
+    diff_files: Optional[List[DiffFile]] = None,
+    parsed_selectors: Optional[List[HunkSelector]] = None,
 ) -> ApplySummary:
+    """Apply one changeset, reusing precomputed base..source diffs if given.
+
+    Diffs and staging run against resolved SHAs (``base_sha``/``source_sha``)
+    rather than refnames, so git skips a ref lookup per call and a ref that
+    moves mid-run cannot shift what the changesets capture. ``diff_entries``
+    and ``diff_files`` let callers that apply many changesets compute the
+    base..source diff once instead of once per changeset.
+    """
+    if base_sha is None:
+        base_sha = git("rev-parse", f"{base_branch}^{{commit}}").stdout.strip()
     mode = str(changeset.get("mode", "paths")).strip() or "paths"
     label = f"Changeset {index}"
     if mode == "paths":
         return _apply_changeset_paths(
-            base_branch=base_branch,
+            base_sha=base_sha,
             source_branch=source_branch,
             source_sha=source_sha,
             index=index,
             changeset=changeset,
+            diff_entries=diff_entries,
         )
     if mode == "patch":
         return _apply_changeset_patch(
@@ -282,12 +392,14 @@ def apply_changeset(
         )
     if mode == "hunks":
         return _apply_changeset_hunks(
-            base_branch=base_branch,
+            base_sha=base_sha,
             source_branch=source_branch,
             source_sha=source_sha,
             index=index,
             changeset=changeset,
             label=label,
+            diff_files=diff_files,
+            parsed_selectors=parsed_selectors,
         )
     raise CommandError(
         f"{label}: unsupported mode '{mode}'. Use 'paths', 'patch', or 'hunks'."
@@ -305,11 +417,18 @@ def create_chain(plan: Dict) -> List[str]:
 
     chain = [branch_name_for(source, i) for i in range(1, total + 1)]
     ensure_branches_exist([base, source])
-    source_sha = git("rev-parse", source).stdout.strip()
-
+    # One batched resolution snapshots both endpoints; every later diff and
+    # checkout runs against these immutable SHAs, not re-resolved refnames.
+    resolved = resolve_objects([f"{base}^{{commit}}", f"{source}^{{commit}}"])
+    base_sha = resolved[f"{base}^{{commit}}"]
+    source_sha = resolved[f"{source}^{{commit}}"]
+    if base_sha is None or source_sha is None:
+        raise CommandError(f"Unable to resolve {base} or {source} to a commit.")
+
+    known_branches = local_branch_names()
     existing_prefix = 0
     for idx, name in enumerate(chain, start=1):
-        exists = branch_exists(name)
+        exists = name in known_branches
         if exists and idx == existing_prefix + 1:
             existing_prefix = idx
             continue
@@ -328,6 +447,33 @@ def create_chain(plan: Dict) -> List[str]:
             "[INFO] create-chain is append-only; delete a branch explicitly if it must be recreated."
         )
 
+    # The base..source diff is identical for every changeset in this run, so
+    # compute each representation once instead of once per changeset.
+    pending_modes = {
+        str(cs.get("mode", "paths")).strip() or "paths"
+        for cs in changesets[existing_prefix:]
+    }
+    diff_entries = (
+        changed_files_between(base_sha, source_sha)
+        if "paths" in pending_modes
+        else None
+    )
+    diff_files = (
+        build_diff(base_sha, source_sha) if "hunks" in pending_modes else None
+    )
+
+    # Parse every pending changeset's hunk selectors before touching any
+    # branch, so a malformed selector fails the run up front instead of
+    # halfway through chain creation; the parsed form is reused per step.
+    parsed_selectors: Dict[int, List[HunkSelector]] = {}
+    for idx in range(start_index, total + 1):
+        cs = changesets[idx - 1]
+        mode = str(cs.get("mode", "paths")).strip() or "paths"
+        if mode == "hunks":
+            parsed_selectors[idx] = parse_hunk_selectors(
+                cs.get("hunk_selectors", []), changeset_label=f"Changeset {idx}"
+            )
+
     with checkout_restore() as original:
         print(f"[INFO] Starting from current branch: {original}")
         prev_branch = base if existing_prefix == 0 else chain[existing_prefix - 1]
@@ -343,6 +489,10 @@ def create_chain(plan: Dict) -> List[str]:
                 source_sha=source_sha,
                 index=idx,
                 changeset=cs,
+                base_sha=base_sha,
+                diff_entries=diff_entries,
+                diff_files=diff_files,
+                parsed_selectors=parsed_selectors.get(idx),
             )
             print(f"[OK] Applied changeset {idx} ({summary.mode}): {summary.message}")
             prev_branch = name
@@ -351,6 +501,62 @@ def create_chain(plan: Dict) -> List[str]:
     return chain
 
 
+_fold_cache: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[str, Tuple[str, ...]]] = {}
+
+
+def _fold_chain_merges(
+    base: str, chain: Sequence[str]
+) -> Tuple[str, Tuple[str, ...]]:
+    """Merge the chain onto base in-memory; return (merged commit, step trees).
+
+    git merge-tree computes each merge result entirely in the object
+    database, so no temp branch or checkout is needed, the user's worktree
+    never moves, and a crash leaves no refs behind. Unreferenced commits
+    created by commit-tree are collected by ordinary git gc.
+
+    Results are cached per resolved SHAs, so a pipeline that runs
+    compare-chain and validate-chain in one process pays for the merge
+    fold once.
+    """
+    resolved = resolve_objects([f"{base}^{{commit}}", *chain])
+    missing = [name for name, sha in resolved.items() if sha is None]
+    if missing:
+        raise CommandError(
+            "Unable to resolve ref(s): " + ", ".join(sorted(missing))
+        )
+    base_sha = resolved[f"{base}^{{commit}}"]
+    # Key on the repo as well as the SHAs: the merged commits written by
+    # commit-tree live in one object database only.
+    key = (str(repo_root()), base_sha, tuple(resolved[name] for name in chain))
+    cached = _fold_cache.get(key)
+    if cached is not None:
+        return cached
+
+    merged = base_sha
+    trees: List[str] = []
+    for name in chain:
+        print(f"[STEP] Merging {name} (in-memory)")
+        result = git("merge-tree", "--write-tree", merged, name, check=False)
+        if result.returncode != 0:
+            detail = (result.stdout or result.stderr or "").strip()
+            raise CommandError(f"Merge of {name} produced conflicts.\n{detail}")
+        tree = result.stdout.splitlines()[0].strip()
+        trees.append(tree)
+        merged = git(
+            "commit-tree",
+            tree,
+            "-p",
+            merged,
+            "-p",
+            name,
+            "-m",
+            f"carve-changesets compare merge of {name}",
+        ).stdout.strip()
+
+    _fold_cache[key] = (merged, tuple(trees))
+    return _fold_cache[key]
+
+
 def compare_chain(plan: Dict) -> Tuple[str, str]:
     ensure_git_repo()
     ensure_clean_tree()
@@ -362,26 +568,57 @@ def compare_chain(plan: Dict) -> Tuple[str, str]:
     chain = [branch_name_for(source, i) for i in range(1, total + 1)]
     ensure_branches_exist([base, source, *chain])
 
-    temp_branch = unique_temp_branch("pcs-temp-compare")
-    print(f"[INFO] Creating temporary comparison branch: {temp_branch}")
-
-    with checkout_restore() as original:
-        try:
-            git("checkout", "-B", temp_branch, base)
-            for name in chain:
-                print(f"[STEP] Merging {name} into {temp_branch}")
-                git("merge", "--no-ff", "--no-edit", name)
-
-            diffstat = diff_stat(temp_branch, source)
-            namestatus = diff_name_status(temp_branch, source)
-        finally:
-            git("checkout", original)
-            delete_branch(temp_branch)
-            print(f"\n[INFO] Restored original branch: {original}")
+    merged, _ = _fold_chain_merges(base, chain)
 
+    diffstat = diff_stat(merged, source)
+    namestatus = diff_name_status(merged, source)
     return diffstat, namestatus
 
 
+def _unchanged_tree_steps(base: str, chain: Sequence[str]) -> Set[int]:
+    """Indices (1-based) whose merged tree equals the previous step's tree.
+
+    Reuses the cached in-memory merge fold; when the fold cannot complete
+    (for example, a conflicting merge) nothing is skipped, so the real
+    worktree merge still reports its error.
+    """
+    try:
+        _, trees = _fold_chain_merges(base, chain)
+    except CommandError:
+        return set()
+    return {
+        idx
+        for idx in range(2, len(chain) + 1)
+        if trees[idx - 1] == trees[idx - 2]
+    }
+
+
+def _validate_chain_step(
+    *, workdir: Path, base: str, name: str, index: int, test_argv: List[str]
+) -> None:
+    """Merge one chain branch onto base in a scratch worktree and run tests."""
+    git("worktree", "add", "--detach", str(workdir), base)
+    try:
+        merge = git(
+            "-C", str(workdir), "merge", "--no-ff", "--no-edit", name, check=False
+        )
+        if merge.returncode != 0:
+            detail = (merge.stderr or merge.stdout or "").strip()
+            raise CommandError(
+                f"Merge of {name} failed after changeset {index}.\n{detail}"
+            )
+        if git("-C", str(workdir), "diff", "--quiet", check=False).returncode != 0:
+            raise CommandError("Working tree became dirty during validate-chain.")
+        # The scratch worktree is deleted right after the run, so any
+        # bytecode cache a Python test runner writes there is wasted I/O.
+        step_env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+        result = execute_argv(test_argv, cwd=str(workdir), env=step_env)
+        if result.returncode != 0:
+            raise CommandError(f"Test command failed after changeset {index}.")
+    finally:
+        git("worktree", "remove", "--force", str(workdir), check=False)
+
+
 def validate_chain(plan: Dict, *, test_argv: object) -> None:
     """Merge changesets in order into a temp branch and run tests after each merge."""
     if isinstance(test_argv, list) and not test_argv:
@@ -400,29 +637,54 @@ def validate_chain(plan: Dict, *, test_argv: object) -> None:
     chain = [branch_name_for(source, i) for i in range(1, total + 1)]
     ensure_branches_exist([base, source, *chain])
 
-    temp_branch = unique_temp_branch("pcs-temp-validate")
-    print(f"[INFO] Creating temporary validation branch: {temp_branch}")
-
-    with checkout_restore() as original:
-        try:
-            git("checkout", "-B", temp_branch, base)
-            for idx, name in enumerate(chain, start=1):
-                print(f"\n[STEP] Merging {name} ({idx} of {total})")
-                git("merge", "--no-ff", "--no-edit", name)
-                print(
-                    f"[STEP] Running tests after changeset {idx}: "
-                    f"{display_argv(effective_test_argv)}"
+    # Each chain branch contains its predecessors, so the tree after the
+    # cumulative merge of steps 1..i equals base merged with chain[i] alone.
+    # That makes the per-step merge+test work independent, and independent
+    # steps run concurrently in detached scratch worktrees while the user's
+    # checkout never moves.
+    max_workers = min(total, os.cpu_count() or 1)
+    print(
+        f"[INFO] Validating {total} chain steps in up to {max_workers} "
+        "scratch worktrees."
+    )
+    print(f"[INFO] Step test command: {display_argv(effective_test_argv)}")
+
+    # A step whose merged tree is identical to the previous step's has
+    # nothing new to test: the same tree already passed (or will pass) one
+    # step earlier. merge-tree computes those trees in-memory, so the probe
+    # costs one fork per step instead of a test-suite run.
+    skipped = _unchanged_tree_steps(base, chain)
+
+    with tempfile.TemporaryDirectory(prefix="pcs-validate-") as scratch:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                idx: pool.submit(
+                    _validate_chain_step,
+                    workdir=Path(scratch) / f"step-{idx}",
+                    base=base,
+                    name=name,
+                    index=idx,
+                    test_argv=effective_test_argv,
                 )
-                if git("diff", "--quiet", check=False).returncode != 0:
-                    raise CommandError(
-                        "Working tree became dirty during validate-chain."
+                for idx, name in enumerate(chain, start=1)
+                if idx not in skipped
+            }
+            first_error: Optional[CommandError] = None
+            for idx in range(1, total + 1):
+                if idx in skipped:
+                    print(
+                        f"[INFO] Tree unchanged after changeset {idx}; "
+                        "skipping tests."
                     )
-                result = execute_argv(effective_test_argv)
-                if result.returncode != 0:
-                    raise CommandError(f"Test command failed after changeset {idx}.")
-        finally:
-            git("checkout", original)
-            delete_branch(temp_branch)
-            print(f"\n[INFO] Restored original branch: {original}")
+                    continue
+                try:
+                    futures[idx].result()
+                    print(f"[OK] Changeset {idx} of {total} validated.")
+                except CommandError as exc:
+                    print(f"[ERROR] Changeset {idx} of {total}: {exc}")
+                    if first_error is None:
+                        first_error = exc
+            if first_error is not None:
+                raise first_error
 
     print("[OK] validate-chain completed successfully.")
@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence
 
-from chain import compare_chain, create_chain, validate_chain
 from command_argv import parse_argv_json
 from common import (
     DEFAULT_PLAN_PATH,
@@ -18,18 +20,14 @@ from common import (
     load_plan,
     validate_plan,
 )
-from db_compare import db_compare
-from github import pr_create, pull_requests_for_source
-from patch_apply import build_diff
-from plan_checks import strict_apply_check, validate_plan_strict
-from preflight import preflight
-from propagate import merge_propagate_from_live, propagate_from_live, push_chain
-from recovery import recover_suffix_from_live
-from rehydrate import RehydrationError, discover_changeset_heads, rehydrate_chain
-from squash_check import squash_check
-from squash_ref import _resolve_base_source, create_squashed_ref
-from status import status_from_live
-from validate import ChainValidation, validate_live_chain
+from rehydrate import RehydrationError
+
+if TYPE_CHECKING:
+    from validate import ChainValidation
+
+# Command implementations are imported inside their cmd_* functions: a
+# short-lived CLI invocation then pays import cost only for the modules the
+# dispatched command actually touches, not the whole toolbox.
 
 READ_ONLY = "read-only"
 LOCAL_MUTATING = "local-mutating"
@@ -56,9 +54,29 @@ COMMAND_MUTATION_CLASSES = {
 }
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_plan(path_str: str, mtime_ns: int, size: int) -> tuple:
+    """Load and validate one plan file, keyed on its identity and stat.
+
+    Commands that consult the plan more than once per process (run,
+    merge-propagate) then parse and walk it once; a rewrite by init_plan
+    changes the mtime and misses the cache naturally.
+    """
+    plan = load_plan(Path(path_str))
+    return plan, validate_plan(plan)
+
+
 def load_and_validate(plan_path: Path) -> Dict:
-    plan = load_plan(plan_path)
-    valid, errors = validate_plan(plan)
+    try:
+        resolved = plan_path.resolve()
+        stat = resolved.stat()
+    except OSError:
+        plan = load_plan(plan_path)
+        valid, errors = validate_plan(plan)
+    else:
+        plan, (valid, errors) = _cached_plan(
+            str(resolved), stat.st_mtime_ns, stat.st_size
+        )
     if not valid:
         for error in errors:
             print(f"[ERROR] {error}")
@@ -103,6 +121,8 @@ def cmd_preflight(args: argparse.Namespace) -> None:
         new_flag="--test-argv",
     )
     test_argv = _parse_optional_argv(args.test_argv, label="--test-argv")
+    from preflight import preflight
+
     preflight(
         base=args.base,
         source=args.source,
@@ -143,6 +163,11 @@ def cmd_validate(args: argparse.Namespace) -> None:
     if not valid:
         raise CommandError("Plan is invalid: " + "; ".join(errors))
     if args.strict:
+        from github import pull_requests_for_source
+        from plan_checks import strict_apply_check, validate_plan_strict
+        from rehydrate import discover_changeset_heads, rehydrate_chain
+        from validate import validate_live_chain
+
         strict_ok, strict_errors, strict_warnings = validate_plan_strict(plan)
         for warning in strict_warnings:
             print(f"[WARN] {warning}")
@@ -176,6 +201,9 @@ def cmd_validate(args: argparse.Namespace) -> None:
 
 
 def cmd_status(args: argparse.Namespace) -> None:
+    from github import pull_requests_for_source
+    from status import status_from_live
+
     pull_requests = (
         []
         if args.local_only
@@ -199,10 +227,14 @@ def _print_live_diagnostics(result: ChainValidation) -> None:
 
 
 def cmd_create_chain(args: argparse.Namespace) -> None:
+    from chain import create_chain
+
     create_chain(load_and_validate(Path(args.plan)))
 
 
 def cmd_compare(args: argparse.Namespace) -> None:
+    from chain import compare_chain
+
     diffstat, names = compare_chain(load_and_validate(Path(args.plan)))
     print("[INFO] Diffstat vs source branch:")
     print(diffstat or "[OK] No diffstat differences detected.")
@@ -217,11 +249,16 @@ def cmd_validate_chain(args: argparse.Namespace) -> None:
         old_flag="--test-cmd",
         new_flag="--test-argv",
     )
+    from chain import validate_chain
+    from github import pull_requests_for_source
+    from rehydrate import rehydrate_chain
+    from validate import validate_live_chain
+
     plan = load_and_validate(Path(args.plan))
     test_argv = (
         _parse_optional_argv(args.test_argv, label="--test-argv")
         if args.test_argv is not None
-        else list(plan.get("test_argv", []))
+        else plan.get("test_argv", [])
     )
     validate_chain(plan, test_argv=test_argv)
     pull_requests = (
@@ -243,15 +280,26 @@ def cmd_validate_chain(args: argparse.Namespace) -> None:
 
 
 def cmd_pr_create(args: argparse.Namespace) -> None:
+    from github import pr_create
+
     plan = load_and_validate(Path(args.plan))
     total = len(plan["changesets"])
-    indices: List[int] = (
-        list(range(1, total + 1)) if args.index is None else [args.index]
+    # pr_create only iterates the indices; a range needs no list copy.
+    indices: Sequence[int] = (
+        range(1, total + 1) if args.index is None else (args.index,)
+    )
+    pr_create(
+        plan,
+        indices=indices,
+        dry_run=args.dry_run,
+        remote=args.remote,
+        max_workers=1 if args.sequential else 4,
     )
-    pr_create(plan, indices=indices, dry_run=args.dry_run, remote=args.remote)
 
 
 def cmd_push_chain(args: argparse.Namespace) -> None:
+    from propagate import push_chain
+
     push_chain(
         load_and_validate(Path(args.plan)),
         remote=args.remote,
@@ -260,6 +308,8 @@ def cmd_push_chain(args: argparse.Namespace) -> None:
 
 
 def cmd_propagate(args: argparse.Namespace) -> None:
+    from propagate import propagate_from_live
+
     propagate_from_live(
         source=args.source,
         base=args.base,
@@ -273,6 +323,8 @@ def cmd_propagate(args: argparse.Namespace) -> None:
 
 
 def cmd_merge_propagate(args: argparse.Namespace) -> None:
+    from propagate import merge_propagate_from_live
+
     merge_propagate_from_live(
         source=args.source,
         base=args.base,
@@ -287,6 +339,8 @@ def cmd_merge_propagate(args: argparse.Namespace) -> None:
 
 
 def cmd_recover_suffix(args: argparse.Namespace) -> None:
+    from recovery import recover_suffix_from_live
+
     recover_suffix_from_live(
         source=args.source,
         base=args.base,
@@ -318,6 +372,8 @@ def cmd_db_compare(args: argparse.Namespace) -> None:
         )
     source_argv = parse_argv_json(args.source_argv, label="--source-argv")
     chain_argv = parse_argv_json(args.chain_argv, label="--chain-argv")
+    from db_compare import db_compare
+
     db_compare(
         load_and_validate(Path(args.plan)),
         source_argv=source_argv,
@@ -329,6 +385,8 @@ def cmd_db_compare(args: argparse.Namespace) -> None:
 
 
 def cmd_hunk_preview(args: argparse.Namespace) -> None:
+    from patch_apply import build_diff_for_path
+
     base = args.base
     source = args.source
     plan_path = Path(args.plan)
@@ -338,29 +396,51 @@ def cmd_hunk_preview(args: argparse.Namespace) -> None:
         source = source or plan.get("source_branch", "")
     if not base or not source:
         raise CommandError("hunk-preview requires --base and --source or a plan.")
+    # A path-scoped diff parses only the previewed file; build_diff_for_path
+    # scopes to both sides of a rename, so lookups by either path see the
+    # same rename hunks that selection operates on.
     matches = [
         item
-        for item in build_diff(base, source)
+        for item in build_diff_for_path(base, source, args.file)
         if args.file in (item.new_path, item.old_path)
     ]
     if not matches:
         raise CommandError(f"No diff hunks found for file: {args.file}")
+    # One compiled alternation scans each body once for any exclude pattern
+    # instead of one substring pass per pattern; "contains" needs every
+    # pattern present, so per-pattern membership remains the right shape.
+    exclude_re = (
+        re.compile("|".join(re.escape(value) for value in args.excludes))
+        if args.excludes
+        else None
+    )
+    # Accumulate the preview and emit it with one write: per-line print
+    # calls cost a syscall each, which dominates when a large preview is
+    # redirected to a file.
+    out: List[str] = []
+    printed = 0
     for item in matches:
-        print(f"[FILE] {item.new_path or item.old_path}")
+        out.append(f"[FILE] {item.new_path or item.old_path}")
         for index, hunk in enumerate(item.hunks, start=1):
-            if args.contains and not all(
-                value in hunk.body_text for value in args.contains
-            ):
+            # body_text is memoized on the hunk, so the filter scans and the
+            # printed body all share one join of the hunk's lines.
+            body = hunk.body_text
+            if args.contains and not all(value in body for value in args.contains):
                 continue
-            if args.excludes and any(
-                value in hunk.body_text for value in args.excludes
-            ):
+            if exclude_re is not None and exclude_re.search(body):
                 continue
-            print(f"[HUNK {index}] {hunk.header}")
-            print("\n".join(hunk.lines[1:]))
+            out.append(f"[HUNK {index}] {hunk.header}")
+            out.append(body)
+            printed += 1
+            if args.limit is not None and printed >= args.limit:
+                sys.stdout.write("\n".join(out) + "\n")
+                return
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_squash_ref(args: argparse.Namespace) -> None:
+    from squash_ref import _resolve_base_source, create_squashed_ref
+
     base, source = _resolve_base_source(
         plan_path=Path(args.plan), base=args.base, source=args.source
     )
@@ -373,6 +453,8 @@ def cmd_squash_ref(args: argparse.Namespace) -> None:
 
 
 def cmd_squash_check(args: argparse.Namespace) -> None:
+    from squash_check import squash_check
+
     diffstat, names = squash_check(load_and_validate(Path(args.plan)))
     print("[INFO] Diffstat vs chain tip after squash-check rebase:")
     print(diffstat or "[OK] No diffstat differences detected.")
@@ -387,6 +469,8 @@ def cmd_run(args: argparse.Namespace) -> None:
         args.force = args.force or args.force_init
         cmd_init_plan(args)
     if args.create_chain:
+        from chain import create_chain
+
         create_chain(load_and_validate(plan_path))
     else:
         print("[NEXT] Review the plan, then run create-chain.")
@@ -454,19 +538,14 @@ def _add_propagation_options(parser: argparse.ArgumentParser) -> None:
     _add_remote_dry_run(parser)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Carve a review-ready source branch into intentional changesets.",
-        epilog="Mutation classes are shown beside every operation; remote mutation is dry-run by default.",
-    )
-    sub = parser.add_subparsers(dest="command", required=True)
-
+def _sub_preflight(sub) -> None:
     item = _command(
         sub, "preflight", "Validate source/base readiness and approved tests."
     )
     _add_preflight_options(item)
-    item.set_defaults(func=cmd_preflight)
 
+
+def _sub_init_plan(sub) -> None:
     item = _command(sub, "init-plan", "Create an ephemeral decomposition plan.")
     _add_plan(item)
     item.add_argument("--base", required=True)
@@ -482,30 +561,35 @@ def build_parser() -> argparse.ArgumentParser:
         help=argparse.SUPPRESS,
     )
     item.add_argument("--force", action="store_true")
-    item.set_defaults(func=cmd_init_plan)
 
+
+def _sub_validate(sub) -> None:
     item = _command(sub, "validate", "Validate the decomposition plan.")
     _add_plan(item)
     item.add_argument("--strict", action="store_true")
     item.add_argument("--remote", default="origin")
     item.add_argument("--local-only", action="store_true")
-    item.set_defaults(func=cmd_validate)
 
+
+def _sub_status(sub) -> None:
     item = _command(sub, "status", "Render chain status from live git and GitHub.")
     item.add_argument("--source", required=True, help="Source branch")
     item.add_argument("--base", default=None, help="Base branch")
     item.add_argument("--remote", default="origin")
     item.add_argument("--local-only", action="store_true")
-    item.set_defaults(func=cmd_status)
 
+
+def _sub_create_chain(sub) -> None:
     item = _command(sub, "create-chain", "Materialize append-only changeset branches.")
     _add_plan(item)
-    item.set_defaults(func=cmd_create_chain)
 
+
+def _sub_compare(sub) -> None:
     item = _command(sub, "compare", "Compare reconstructed chain output with source.")
     _add_plan(item)
-    item.set_defaults(func=cmd_compare)
 
+
+def _sub_validate_chain(sub) -> None:
     item = _command(
         sub, "validate-chain", "Run approved step tests and live chain validation."
     )
@@ -520,29 +604,38 @@ def build_parser() -> argparse.ArgumentParser:
     )
     item.add_argument("--remote", default="origin")
     item.add_argument("--local-only", action="store_true")
-    item.set_defaults(func=cmd_validate_chain)
 
+
+def _sub_pr_create(sub) -> None:
     item = _command(sub, "pr-create", "Publish correctly based changeset PRs.")
     _add_plan(item)
     item.add_argument("--index", type=int)
     item.add_argument("--remote", default="origin")
+    item.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Create PRs one at a time instead of overlapping gh calls.",
+    )
     _add_remote_dry_run(item)
-    item.set_defaults(func=cmd_pr_create)
 
+
+def _sub_push_chain(sub) -> None:
     item = _command(sub, "push-chain", "Push changeset branches with exact leases.")
     _add_plan(item)
     item.add_argument("--remote", default="origin")
     _add_remote_dry_run(item)
-    item.set_defaults(func=cmd_push_chain)
 
+
+def _sub_propagate(sub) -> None:
     item = _command(
         sub,
         "propagate",
         "Verify a merged changeset and propagate its downstream suffix.",
     )
     _add_propagation_options(item)
-    item.set_defaults(func=cmd_propagate)
 
+
+def _sub_merge_propagate(sub) -> None:
     item = _command(
         sub,
         "merge-propagate",
@@ -552,8 +645,9 @@ def build_parser() -> argparse.ArgumentParser:
     item.add_argument(
         "--method", choices=("merge", "squash", "rebase"), default="merge"
     )
-    item.set_defaults(func=cmd_merge_propagate)
 
+
+def _sub_recover_suffix(sub) -> None:
     item = _command(
         sub,
         "recover-suffix",
@@ -577,8 +671,9 @@ def build_parser() -> argparse.ArgumentParser:
         help="Acknowledge explicit suffix-recovery authority",
     )
     _add_remote_dry_run(item)
-    item.set_defaults(func=cmd_recover_suffix)
 
+
+def _sub_db_compare(sub) -> None:
     item = _command(sub, "db-compare", "Compare source and chain database schemas.")
     _add_plan(item)
     source_command = item.add_mutually_exclusive_group()
@@ -608,8 +703,9 @@ def build_parser() -> argparse.ArgumentParser:
             "The default uses an automatically removed restricted directory."
         ),
     )
-    item.set_defaults(func=cmd_db_compare)
 
+
+def _sub_hunk_preview(sub) -> None:
     item = _command(sub, "hunk-preview", "Preview explicit textual hunk selectors.")
     _add_plan(item)
     item.add_argument("--base", default="")
@@ -617,22 +713,28 @@ def build_parser() -> argparse.ArgumentParser:
     item.add_argument("--file", required=True)
     item.add_argument("--contains", action="append", default=[])
     item.add_argument("--excludes", action="append", default=[])
-    item.set_defaults(func=cmd_hunk_preview)
+    item.add_argument(
+        "--limit", type=int, default=None, help="Stop after printing N hunks"
+    )
+
 
+def _sub_squash_ref(sub) -> None:
     item = _command(sub, "squash-ref", "Create a local-only squashed source reference.")
     _add_plan(item)
     item.add_argument("--base", default="")
     item.add_argument("--source", default="")
     item.add_argument("--reuse-existing", action="store_true")
     item.add_argument("--recreate", action="store_true")
-    item.set_defaults(func=cmd_squash_ref)
 
+
+def _sub_squash_check(sub) -> None:
     item = _command(
         sub, "squash-check", "Compare a squashed source against the chain tip."
     )
     _add_plan(item)
-    item.set_defaults(func=cmd_squash_check)
 
+
+def _sub_run(sub) -> None:
     item = _command(
         sub, "run", "Preflight, initialize a plan, and optionally materialize it."
     )
@@ -643,16 +745,95 @@ def build_parser() -> argparse.ArgumentParser:
     item.add_argument("--force", action="store_true")
     item.add_argument("--force-init", action="store_true")
     item.add_argument("--create-chain", action="store_true")
-    item.set_defaults(func=cmd_run)
+
+
+_SUBCOMMAND_BUILDERS = {
+    "preflight": _sub_preflight,
+    "init-plan": _sub_init_plan,
+    "validate": _sub_validate,
+    "status": _sub_status,
+    "create-chain": _sub_create_chain,
+    "compare": _sub_compare,
+    "validate-chain": _sub_validate_chain,
+    "pr-create": _sub_pr_create,
+    "push-chain": _sub_push_chain,
+    "propagate": _sub_propagate,
+    "merge-propagate": _sub_merge_propagate,
+    "recover-suffix": _sub_recover_suffix,
+    "db-compare": _sub_db_compare,
+    "hunk-preview": _sub_hunk_preview,
+    "squash-ref": _sub_squash_ref,
+    "squash-check": _sub_squash_check,
+    "run": _sub_run,
+}
+
+# Dispatch reads the command name, not a callable stashed on the Namespace by
+# every subparser; parser construction and dispatch stay decoupled, which is
+# what lets a dispatched invocation build only its own subparser.
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "preflight": cmd_preflight,
+    "init-plan": cmd_init_plan,
+    "validate": cmd_validate,
+    "status": cmd_status,
+    "create-chain": cmd_create_chain,
+    "compare": cmd_compare,
+    "validate-chain": cmd_validate_chain,
+    "pr-create": cmd_pr_create,
+    "push-chain": cmd_push_chain,
+    "propagate": cmd_propagate,
+    "merge-propagate": cmd_merge_propagate,
+    "recover-suffix": cmd_recover_suffix,
+    "db-compare": cmd_db_compare,
+    "hunk-preview": cmd_hunk_preview,
+    "squash-ref": cmd_squash_ref,
+    "squash-check": cmd_squash_check,
+    "run": cmd_run,
+}
+
+
+def build_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with ``only`` set, register just that subcommand.
+
+    A dispatched invocation needs one subparser, not all seventeen, and
+    argparse's per-argument setup cost is the bulk of parser construction.
+    ``--help`` and unknown tokens still get the complete parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Carve a review-ready source branch into intentional changesets.",
+        epilog="Mutation classes are shown beside every operation; remote mutation is dry-run by default.",
+    )
+    parser.add_argument(
+        "--paranoid",
+        action="store_true",
+        help="Run the trailing clean-tree check even for read-only commands.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    if only is not None and only in _SUBCOMMAND_BUILDERS:
+        _SUBCOMMAND_BUILDERS[only](sub)
+        return parser
+    for builder in _SUBCOMMAND_BUILDERS.values():
+        builder(sub)
     return parser
 
 
+def _peek_subcommand(argv: Sequence[str]) -> Optional[str]:
+    """Return the first non-flag token, which names the subcommand if valid."""
+    for token in argv:
+        if not token.startswith("-"):
+            return token
+        return None
+    return None
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    tokens = list(argv) if argv is not None else sys.argv[1:]
+    parser = build_parser(_peek_subcommand(tokens))
+    args = parser.parse_args(tokens)
     try:
-        args.func(args)
-        if args.mutation_class != READ_ONLY:
+        COMMANDS[args.command](args)
+        # Read-only commands cannot have dirtied the tree, so their trailing
+        # git status spawn is pure overhead unless explicitly requested.
+        if args.paranoid or args.mutation_class != READ_ONLY:
             ensure_clean_tree()
         return 0
     except (CommandError, RehydrationError) as exc:
@@ -51,7 +51,14 @@ def display_argv(argv: Any) -> str:
 
 
 def execute_argv(
-    argv: Any, *, text: bool = False, capture_output: bool = False
+    argv: Any,
+    *,
+    text: bool = False,
+    capture_output: bool = False,
+    stdout: Any = None,
+    stderr: Any = None,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
 ) -> subprocess.CompletedProcess:
     """Execute an already approved argv array without implicit shell parsing."""
 
@@ -62,7 +69,11 @@ def execute_argv(
             shell=False,
             text=text,
             capture_output=capture_output,
+            stdout=stdout,
+            stderr=stderr,
             check=False,
+            cwd=cwd,
+            env=env,
         )
     except FileNotFoundError as exc:
         raise CommandError(f"Command not found: {checked[0]}") from exc
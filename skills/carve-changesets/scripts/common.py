@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
-import datetime as _dt
+import functools
 import json
+import os
 import re
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 DEFAULT_PLAN_PATH = Path(".carve-changesets/plan.json")
 
@@ -34,52 +49,171 @@ TEST_COMMAND_HINTS: Tuple[str, ...] = (
 )
 
 
+def _to_text(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
 def run(
-    cmd: Sequence[str], *, capture: bool = True, check: bool = True
+    cmd: Sequence[str],
+    *,
+    capture: bool = True,
+    check: bool = True,
+    input: Optional[str] = None,
+    decode: bool = True,
 ) -> subprocess.CompletedProcess:
-    """Run a command and return the completed process."""
+    """Run a command and return the completed process.
+
+    Output is captured as bytes and decoded afterwards; callers that ignore
+    the output entirely can pass ``decode=False`` to skip that work. Error
+    details are always decoded.
+    """
     try:
         result = subprocess.run(
-            list(cmd),
-            text=True,
+            cmd if isinstance(cmd, list) else list(cmd),
             capture_output=capture,
             check=False,
+            input=input.encode("utf-8") if input is not None else None,
+            # A 64 KiB pipe buffer keeps large diff/status outputs from being
+            # drained in small reads.
+            bufsize=65536,
         )
     except FileNotFoundError as exc:
         raise CommandError(f"Command not found: {cmd[0]}") from exc
 
     if check and result.returncode != 0:
-        stderr = (result.stderr or "").strip()
-        stdout = (result.stdout or "").strip()
+        stderr = _to_text(result.stderr).strip()
+        stdout = _to_text(result.stdout).strip()
         detail = stderr or stdout or f"exit code {result.returncode}"
         raise CommandError(f"Command failed: {' '.join(cmd)}\n{detail}")
+    if decode:
+        result.stdout = _to_text(result.stdout) if result.stdout is not None else None
+        result.stderr = _to_text(result.stderr) if result.stderr is not None else None
     return result
 
 
 def git(
-    *args: str, capture: bool = True, check: bool = True
+    *args: str,
+    capture: bool = True,
+    check: bool = True,
+    input: Optional[str] = None,
+    decode: bool = True,
 ) -> subprocess.CompletedProcess:
     """Run a git command."""
-    return run(("git",) + args, capture=capture, check=check)
+    # Every git spawn funnels through here, so this is the one place that
+    # can see HEAD move and drop the memoized branch lookups. rebase belongs
+    # in the set because `rebase --onto <new> <old> <branch>` implicitly
+    # checks out <branch>.
+    if args and args[0] in ("checkout", "switch", "rebase"):
+        _branch_cache.clear()
+    return run(
+        ("git",) + args, capture=capture, check=check, input=input, decode=decode
+    )
+
+
+def git_lines(*args: str) -> Iterator[str]:
+    """Yield git stdout line by line without buffering the whole output.
+
+    Consumers that reduce large output to a small structure (sets of ref
+    names, first-match scans) avoid holding bytes + decoded str +
+    ``splitlines`` list in memory at once. Raises CommandError on a nonzero
+    exit once the stream is drained.
+    """
+    cmd = ["git", *args]
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=65536,
+        )
+    except FileNotFoundError as exc:
+        raise CommandError("Command not found: git") from exc
+    assert proc.stdout is not None
+    try:
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read() if proc.stderr else ""
+        if proc.stderr:
+            proc.stderr.close()
+        returncode = proc.wait()
+        if returncode != 0:
+            detail = stderr.strip() or f"exit code {returncode}"
+            raise CommandError(f"Command failed: {' '.join(cmd)}\n{detail}")
 
 
 def ensure_git_repo() -> None:
     git("rev-parse", "--is-inside-work-tree")
 
 
-def repo_root() -> Path:
+@functools.lru_cache(maxsize=4)
+def _repo_root_for(cwd: str) -> Path:
     return Path(git("rev-parse", "--show-toplevel").stdout.strip())
 
 
-def ensure_clean_tree() -> None:
+def repo_root() -> Path:
+    # The toplevel never changes for a given working directory, so one
+    # getcwd() replaces a git spawn on every repeated call; keying on the
+    # directory keeps tests that hop between scratch repos correct.
+    return _repo_root_for(os.getcwd())
+
+
+@dataclass(frozen=True)
+class RepoState:
+    """One snapshot of the repo facts that preflight-style checks consult."""
+
+    branch: str
+    dirty: bool
+    branches: FrozenSet[str]
+
+
+def collect_repo_state() -> RepoState:
+    """Collect current branch, cleanliness, and local refs in two git calls.
+
+    Checks that each spawn their own git process re-read repository state
+    that cannot have changed between them; one snapshot serves them all.
+    Running ``git status`` also proves we are inside a work tree.
+    """
     status = git(
         "status",
         "--porcelain",
+        "--branch",
         "--",
         ".",
         ":(exclude).carve-changesets",
-    ).stdout.strip()
-    if status:
+    )
+    branch = ""
+    dirty = False
+    for line in status.stdout.splitlines():
+        if line.startswith("## "):
+            branch = line[3:].split("...", 1)[0].strip()
+        elif line.strip():
+            dirty = True
+    return RepoState(
+        branch=branch, dirty=dirty, branches=frozenset(local_branch_names())
+    )
+
+
+def ensure_clean_tree(state: Optional[RepoState] = None) -> None:
+    if state is not None:
+        dirty = state.dirty
+    else:
+        dirty = bool(
+            git(
+                "status",
+                "--porcelain",
+                "--",
+                ".",
+                ":(exclude).carve-changesets",
+            ).stdout.strip()
+        )
+    if dirty:
         raise CommandError(
             "Working tree is not clean. Commit, stash, or discard changes first."
         )
@@ -104,13 +238,108 @@ def is_path_ignored(path: Path | str) -> bool:
     return False
 
 
+def translate_glob(pattern: str) -> str:
+    """Translate one path glob into a regex source string.
+
+    Unlike ``fnmatch.translate``, this keeps ``*`` and ``?`` within one path
+    segment and reserves ``**`` for crossing directory boundaries, matching
+    the semantics plan authors expect from patterns like ``src/**/*.py``.
+    """
+    out: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "*":
+            if pattern[i : i + 2] == "**":
+                i += 2
+                if i < n and pattern[i] == "/":
+                    # "a/**/b" also matches "a/b".
+                    i += 1
+                    out.append(r"(?:[^/]*/)*")
+                else:
+                    out.append(r".*")
+            else:
+                out.append(r"[^/]*")
+                i += 1
+        elif ch == "?":
+            out.append(r"[^/]")
+            i += 1
+        elif ch == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(r"\[")
+                i += 1
+            else:
+                body = pattern[i + 1 : j].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j + 1
+        else:
+            out.append(re.escape(ch))
+            i += 1
+    return r"(?s:" + "".join(out) + r")\Z"
+
+
+@functools.lru_cache(maxsize=None)
+def compile_globs(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile path globs into one alternation regex, or None if empty."""
+    if not patterns:
+        return None
+    return re.compile("|".join(translate_glob(pat) for pat in patterns))
+
+
+def resolve_objects(names: Sequence[str]) -> Dict[str, Optional[str]]:
+    """Resolve many revisions to object SHAs through one git process.
+
+    One ``git cat-file --batch-check`` invocation replaces a ``rev-parse``
+    fork per revision; unresolvable names map to None. A fresh process per
+    batch (rather than a long-lived worker) means the answers always reflect
+    the current ref state.
+    """
+    if not names:
+        return {}
+    result = git(
+        "cat-file",
+        "--batch-check=%(objectname)",
+        input="\n".join(names) + "\n",
+        check=False,
+    )
+    resolved: Dict[str, Optional[str]] = {}
+    lines = result.stdout.splitlines()
+    for name, line in zip(names, lines):
+        value = line.strip()
+        resolved[name] = value if value and " " not in value else None
+    for name in names[len(lines) :]:
+        resolved[name] = None
+    return resolved
+
+
 def branch_exists(name: str) -> bool:
-    result = git("rev-parse", "--verify", name, capture=True, check=False)
+    result = git(
+        "rev-parse", "--verify", name, capture=True, check=False, decode=False
+    )
     return result.returncode == 0
 
 
+# Memoized per working directory and dropped by git() whenever a checkout or
+# switch can move HEAD.
+_branch_cache: Dict[str, str] = {}
+
+
 def current_branch() -> str:
-    return git("rev-parse", "--abbrev-ref", "HEAD").stdout.strip()
+    cwd = os.getcwd()
+    cached = _branch_cache.get(cwd)
+    if cached is None:
+        cached = git("rev-parse", "--abbrev-ref", "HEAD").stdout.strip()
+        _branch_cache[cwd] = cached
+    return cached
 
 
 def merge_base(base: str, source: str) -> str:
@@ -118,9 +347,18 @@ def merge_base(base: str, source: str) -> str:
 
 
 def compute_freshness(base: str, source: str) -> Dict[str, object]:
-    base_head = git("rev-parse", base).stdout.strip()
-    source_head = git("rev-parse", source).stdout.strip()
-    mb = merge_base(base, source)
+    # The merge-base walk and the head resolution are independent git
+    # processes; running the walk in a worker thread overlaps the two spawns.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        mb_future = pool.submit(merge_base, base, source)
+        resolved = resolve_objects([base, source])
+        base_head = resolved.get(base)
+        source_head = resolved.get(source)
+        if not base_head or not source_head:
+            mb_future.cancel()
+            missing = [name for name in (base, source) if not resolved.get(name)]
+            raise CommandError("Could not resolve: " + ", ".join(missing))
+        mb = mb_future.result()
     return {
         "base_head": base_head,
         "source_head": source_head,
@@ -133,17 +371,41 @@ def diff_name_status(base: str, source: str) -> str:
     return git("diff", "--name-status", f"{base}..{source}").stdout.strip()
 
 
+def diff_name_status_z(base: str, source: str) -> str:
+    """NUL-terminated name-status output for machine parsing."""
+    return git("diff", "--name-status", "-z", f"{base}..{source}").stdout
+
+
 def diff_stat(base: str, source: str) -> str:
     return git("diff", "--stat", f"{base}..{source}").stdout.strip()
 
 
 def unique_temp_branch(prefix: str) -> str:
-    ts = _dt.datetime.now().strftime("%Y%m%d-%H%M%S")
-    return f"{prefix}-{ts}"
+    # time.localtime plus an f-string gives the same local timestamp without
+    # importing datetime or walking strftime's locale tables. The pid suffix
+    # keeps two invocations within the same second from colliding.
+    t = time.localtime()
+    return (
+        f"{prefix}-{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+        f"-{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}-{os.getpid():x}"
+    )
 
 
 def delete_branch(name: str) -> None:
-    git("branch", "-D", name, check=False)
+    git("branch", "-D", name, check=False, decode=False)
+
+
+def delete_branches(names: Iterable[str]) -> None:
+    """Delete local branches with one ``update-ref --stdin`` process.
+
+    A per-branch ``git branch -D`` loop forks once per name; the stdin
+    script deletes them all in a single spawn and tolerates names that no
+    longer exist.
+    """
+    script = "".join(f"delete refs/heads/{name}\n" for name in names)
+    if not script:
+        return
+    git("update-ref", "--stdin", input=script, check=False, decode=False)
 
 
 @contextmanager
@@ -158,6 +420,22 @@ def message_file(message: str):
         yield handle.name
 
 
+@contextmanager
+def pathspec_file(paths: Sequence[str]):
+    """Yield a temporary NUL-separated pathspec file for --pathspec-from-file.
+
+    NUL separation keeps paths containing spaces or newlines safe, and one
+    batched git call replaces a subprocess fork per path.
+    """
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", encoding="utf-8", prefix="carve-pathspec-"
+    ) as handle:
+        handle.write("\0".join(paths))
+        handle.flush()
+        yield handle.name
+
+
 def commit_with_message(message: str) -> None:
     """Commit staged changes using the repository-required file interface."""
 
@@ -165,8 +443,39 @@ def commit_with_message(message: str) -> None:
         git("commit", "-F", path)
 
 
+def commit_staged(message: str) -> bool:
+    """Commit staged changes; return False when nothing was staged.
+
+    Attempting the commit directly saves the separate ``git diff --cached``
+    probe per changeset; the probe only runs on the rare failure path to
+    distinguish an empty index from a real commit error.
+    """
+
+    with message_file(message) as path:
+        result = git("commit", "-F", path, check=False)
+    if result.returncode == 0:
+        return True
+    if git("diff", "--cached", "--quiet", check=False).returncode == 0:
+        return False
+    detail = (result.stderr or "").strip() or (result.stdout or "").strip()
+    raise CommandError(f"git commit failed.\n{detail or 'Unknown commit error.'}")
+
+
+def local_branch_names() -> Set[str]:
+    """Snapshot every local branch name with one git call."""
+    return {
+        name
+        for name in git_lines("for-each-ref", "--format=%(refname:short)", "refs/heads/")
+        if name
+    }
+
+
 def ensure_branches_exist(branches: Iterable[str]) -> None:
-    missing = [b for b in branches if not branch_exists(b)]
+    # One for-each-ref snapshot answers the common all-local case; anything
+    # not found there still gets the single-ref rev-parse probe so refs that
+    # are not local branches keep resolving.
+    known = local_branch_names()
+    missing = [b for b in branches if b not in known and not branch_exists(b)]
     if missing:
         raise CommandError("Missing branch(es):\n" + "\n".join(missing))
 
@@ -198,24 +507,45 @@ def checkout_restore(target: Optional[str] = None):
             git("checkout", original)
 
 
+try:  # Optional accelerator; the CLI stays stdlib-only without it.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(raw: bytes) -> object:
+    """Parse JSON from bytes, via orjson when installed.
+
+    Raises ValueError on malformed input; orjson's JSONDecodeError and the
+    stdlib's both subclass it.
+    """
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
 def load_plan(path: Path) -> Dict:
     try:
-        return json.loads(path.read_text())
+        raw = path.read_bytes()
     except FileNotFoundError as exc:
         raise CommandError(f"Plan file not found: {path}") from exc
-    except json.JSONDecodeError as exc:
+    try:
+        return _json_loads(raw)
+    except ValueError as exc:
         raise CommandError(f"Invalid JSON in plan file {path}: {exc}") from exc
 
 
+def _is_str_list(value: object) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
 def validate_plan(plan: Dict) -> Tuple[bool, List[str]]:
     errors: List[str] = []
 
     def require_string(key: str) -> None:
-        if (
-            key not in plan
-            or not isinstance(plan.get(key), str)
-            or not str(plan[key]).strip()
-        ):
+        # A missing key yields None, which fails the isinstance check.
+        value = plan.get(key)
+        if not isinstance(value, str) or not value.strip():
             errors.append(f"Missing or invalid string field: {key}")
 
     require_string("feature_title")
@@ -247,15 +577,16 @@ def validate_plan(plan: Dict) -> Tuple[bool, List[str]]:
             errors.append(f"Changeset {idx} must be an object.")
             continue
 
-        for key in ("slug", "description"):
-            if key not in cs:
-                errors.append(f"Changeset {idx} missing required field: {key}")
-
-        if "slug" in cs and (not isinstance(cs["slug"], str) or not cs["slug"].strip()):
+        # Bind each field once; every check below runs against the local.
+        slug = cs.get("slug")
+        description = cs.get("description")
+        if "slug" not in cs:
+            errors.append(f"Changeset {idx} missing required field: slug")
+        elif not isinstance(slug, str) or not slug.strip():
             errors.append(f"Changeset {idx} has invalid slug.")
-        if "description" in cs and (
-            not isinstance(cs["description"], str) or not cs["description"].strip()
-        ):
+        if "description" not in cs:
+            errors.append(f"Changeset {idx} missing required field: description")
+        elif not isinstance(description, str) or not description.strip():
             errors.append(f"Changeset {idx} has invalid description.")
 
         mode = str(cs.get("mode", "paths")).strip() or "paths"
@@ -265,18 +596,14 @@ def validate_plan(plan: Dict) -> Tuple[bool, List[str]]:
             )
 
         include = cs.get("include_paths", [])
-        if include and (
-            not isinstance(include, list)
-            or not all(isinstance(p, str) for p in include)
-        ):
+        if include and not _is_str_list(include):
             errors.append(
                 f"Changeset {idx} include_paths must be a string array when provided."
             )
-        if mode == "paths":
-            if not isinstance(include, list) or not include:
-                errors.append(
-                    f"Changeset {idx} include_paths must be a non-empty string array for mode=paths."
-                )
+        if mode == "paths" and (not isinstance(include, list) or not include):
+            errors.append(
+                f"Changeset {idx} include_paths must be a non-empty string array for mode=paths."
+            )
 
         if mode == "patch":
             patch_file = cs.get("patch_file")
@@ -297,10 +624,7 @@ def validate_plan(plan: Dict) -> Tuple[bool, List[str]]:
                 )
 
         exclude = cs.get("exclude_paths", [])
-        if exclude and (
-            not isinstance(exclude, list)
-            or not all(isinstance(p, str) for p in exclude)
-        ):
+        if exclude and not _is_str_list(exclude):
             errors.append(
                 f"Changeset {idx} exclude_paths must be a string array when provided."
             )
@@ -312,10 +636,7 @@ def validate_plan(plan: Dict) -> Tuple[bool, List[str]]:
             )
 
         pr_notes = cs.get("pr_notes", [])
-        if pr_notes and (
-            not isinstance(pr_notes, list)
-            or not all(isinstance(p, str) for p in pr_notes)
-        ):
+        if pr_notes and not _is_str_list(pr_notes):
             errors.append(
                 f"Changeset {idx} pr_notes must be a string array when provided."
             )
@@ -364,38 +685,60 @@ def init_plan(
         "changesets": [default_changeset(i) for i in range(1, changesets + 1)],
     }
 
-    plan_path.write_text(json.dumps(plan, indent=2) + "\n")
+    if _orjson is not None:
+        raw = _orjson.dumps(plan, option=_orjson.OPT_INDENT_2) + b"\n"
+    else:
+        raw = (json.dumps(plan, indent=2) + "\n").encode("utf-8")
+    # Write to a sibling temp file and rename so a crash mid-write can never
+    # leave a torn plan behind, especially on the --force overwrite path.
+    tmp_path = plan_path.with_name(plan_path.name + ".tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(raw)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, plan_path)
+
+
+# Discovery scans the same handful of patterns over every code block and
+# workflow file; compiling them once at import keeps the scan loops free of
+# per-call pattern-cache lookups.
+_TEST_WORD_RE = re.compile(r"\b(test|pytest)\b")
+# One alternation scans a command once for every known hint instead of one
+# substring pass per hint.
+_HINT_RE = re.compile("|".join(map(re.escape, TEST_COMMAND_HINTS)))
+_RECIPE_LABEL_RE = re.compile(
+    r"^(?:[A-Za-z_][A-Za-z0-9_-]*|\"[A-Za-z0-9_-]+\"|'[A-Za-z0-9_-]+'):"
+)
+_TEST_TARGET_RE = re.compile(r"(?m)^test\s*:")
+_RUN_LINE_RE = re.compile(r"^\s*run:\s*(.*)$")
 
 
+@functools.lru_cache(maxsize=1024)
 def _is_test_command(cmd: str) -> bool:
     lower = cmd.lower()
-    if any(hint in lower for hint in TEST_COMMAND_HINTS):
+    if _HINT_RE.search(lower):
         return True
     # Catch generic patterns like "just test-foo" or "make test-all".
-    return bool(re.search(r"\b(test|pytest)\b", lower))
-
-
-def _extract_code_blocks(text: str) -> List[str]:
-    # Keep this permissive; we are mining for likely commands, not parsing Markdown.
-    pattern = re.compile(r"```[a-zA-Z0-9_-]*\n(.*?)```", re.DOTALL)
-    return [m.group(1) for m in pattern.finditer(text)]
-
-
-def _commands_from_block(block: str) -> List[str]:
-    commands: List[str] = []
-    for raw_line in block.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if re.match(r"^[A-Za-z_][A-Za-z0-9_-]*:", line):
-            continue
-        if re.match(r"^\"[A-Za-z0-9_-]+\":", line):
-            continue
-        if re.match(r"^'[A-Za-z0-9_-]+':", line):
-            continue
-        # Treat each non-empty line as a potential command.
-        commands.append(line)
-    return commands
+    return bool(_TEST_WORD_RE.search(lower))
+
+
+def _extract_code_blocks(text: str) -> Iterator[str]:
+    # Keep this permissive; we are mining for likely commands, not parsing
+    # Markdown. A linear find() scan yields one block at a time instead of
+    # materializing every block from a DOTALL regex pass over the whole file.
+    pos = 0
+    while True:
+        start = text.find("```", pos)
+        if start == -1:
+            return
+        fence_end = text.find("\n", start + 3)
+        if fence_end == -1:
+            return
+        close = text.find("```", fence_end + 1)
+        if close == -1:
+            return
+        yield text[fence_end + 1 : close]
+        pos = close + 3
 
 
 def parse_agents_test_commands(path: Path) -> List[str]:
@@ -404,15 +747,23 @@ def parse_agents_test_commands(path: Path) -> List[str]:
     except FileNotFoundError:
         return []
 
+    # One fused pass: each streamed block's lines are filtered and collected
+    # directly, with no intermediate per-block command list.
     candidates: List[str] = []
     seen: Set[str] = set()
     for block in _extract_code_blocks(text):
-        for cmd in _commands_from_block(block):
-            if not _is_test_command(cmd):
+        for raw_line in block.splitlines():
+            # Treat each non-empty, non-comment, non-label line as a
+            # potential command.
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
                 continue
-            if cmd not in seen:
-                seen.add(cmd)
-                candidates.append(cmd)
+            if _RECIPE_LABEL_RE.match(line):
+                continue
+            if line in seen or not _is_test_command(line):
+                continue
+            seen.add(line)
+            candidates.append(line)
     return candidates
 
 
@@ -424,35 +775,36 @@ def _add_suggestion(cmd: str, suggestions: List[str], seen: Set[str]) -> None:
     suggestions.append(clean)
 
 
-def _suggest_from_justfile(root: Path, suggestions: List[str], seen: Set[str]) -> None:
+def _suggest_from_justfile(
+    root: Path, entries: Set[str], suggestions: List[str], seen: Set[str]
+) -> None:
     for name in ("justfile", "Justfile"):
-        path = root / name
-        if not path.exists():
+        if name not in entries:
             continue
-        text = path.read_text()
-        if re.search(r"(?m)^test\s*:", text):
+        text = (root / name).read_text()
+        if _TEST_TARGET_RE.search(text):
             _add_suggestion("just test", suggestions, seen)
 
 
-def _suggest_from_makefile(root: Path, suggestions: List[str], seen: Set[str]) -> None:
+def _suggest_from_makefile(
+    root: Path, entries: Set[str], suggestions: List[str], seen: Set[str]
+) -> None:
     for name in ("Makefile", "makefile"):
-        path = root / name
-        if not path.exists():
+        if name not in entries:
             continue
-        text = path.read_text()
-        if re.search(r"(?m)^test\s*:", text):
+        text = (root / name).read_text()
+        if _TEST_TARGET_RE.search(text):
             _add_suggestion("make test", suggestions, seen)
 
 
 def _suggest_from_package_json(
-    root: Path, suggestions: List[str], seen: Set[str]
+    root: Path, entries: Set[str], suggestions: List[str], seen: Set[str]
 ) -> None:
-    path = root / "package.json"
-    if not path.exists():
+    if "package.json" not in entries:
         return
     try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError:
+        data = _json_loads((root / "package.json").read_bytes())
+    except ValueError:
         return
 
     scripts = data.get("scripts") if isinstance(data, dict) else None
@@ -460,11 +812,11 @@ def _suggest_from_package_json(
     if not isinstance(test_script, str) or not test_script.strip():
         return
 
-    if (root / "pnpm-lock.yaml").exists():
+    if "pnpm-lock.yaml" in entries:
         tool_cmd = "pnpm test"
-    elif (root / "yarn.lock").exists():
+    elif "yarn.lock" in entries:
         tool_cmd = "yarn test"
-    elif (root / "bun.lockb").exists():
+    elif "bun.lockb" in entries:
         tool_cmd = "bun test"
     else:
         tool_cmd = "npm test"
@@ -475,82 +827,102 @@ def _suggest_from_package_json(
     _add_suggestion(test_script, suggestions, seen)
 
 
-def _suggest_from_python_project(
-    root: Path, suggestions: List[str], seen: Set[str]
-) -> None:
-    pyproject = root / "pyproject.toml"
-    setup_cfg = root / "setup.cfg"
-    tests_dir = root / "tests"
+def _file_contains(path: Path, needle: bytes) -> bool:
+    """Scan a file for one byte needle in chunks, stopping at the first hit.
 
-    pyproject_text = pyproject.read_text() if pyproject.exists() else ""
-    setup_cfg_text = setup_cfg.read_text() if setup_cfg.exists() else ""
+    A small overlap window catches needles that straddle a chunk boundary;
+    nothing is decoded and at most one chunk is in memory.
+    """
+    overlap = len(needle) - 1
+    tail = b""
+    with path.open("rb") as fh:
+        while True:
+            chunk = fh.read(65536)
+            if not chunk:
+                return False
+            window = tail + chunk
+            if needle in window:
+                return True
+            tail = window[-overlap:] if overlap else b""
 
-    if "[tool.pytest" in pyproject_text or "pytest" in pyproject_text:
+
+def _suggest_from_python_project(
+    root: Path, entries: Set[str], suggestions: List[str], seen: Set[str]
+) -> None:
+    # "[tool.pytest" and "[tool:pytest]" both contain "pytest", so one
+    # needle covers every marker; the setup.cfg probe only runs when
+    # pyproject.toml did not already settle it.
+    if "pyproject.toml" in entries and _file_contains(
+        root / "pyproject.toml", b"pytest"
+    ):
         _add_suggestion("python -m pytest", suggestions, seen)
         return
-    if "[tool:pytest]" in setup_cfg_text or "pytest" in setup_cfg_text:
+    if "setup.cfg" in entries and _file_contains(root / "setup.cfg", b"pytest"):
         _add_suggestion("python -m pytest", suggestions, seen)
         return
 
-    if tests_dir.exists() and any(p.suffix == ".py" for p in tests_dir.rglob("*.py")):
+    # rglob is lazy, so probing for one entry stops the walk at the first
+    # match instead of filtering every file it yields.
+    if "tests" in entries and next(iter((root / "tests").rglob("*.py")), None):
         _add_suggestion("python -m pytest", suggestions, seen)
 
 
 def _suggest_from_other_roots(
-    root: Path, suggestions: List[str], seen: Set[str]
+    root: Path, entries: Set[str], suggestions: List[str], seen: Set[str]
 ) -> None:
-    if (root / "tox.ini").exists():
+    if "tox.ini" in entries:
         _add_suggestion("tox", suggestions, seen)
-    if (root / "noxfile.py").exists():
+    if "noxfile.py" in entries:
         _add_suggestion("nox", suggestions, seen)
-    if (root / "go.mod").exists():
+    if "go.mod" in entries:
         _add_suggestion("go test ./...", suggestions, seen)
-    if (root / "Cargo.toml").exists():
+    if "Cargo.toml" in entries:
         _add_suggestion("cargo test", suggestions, seen)
 
 
-def _suggest_from_workflows(root: Path, suggestions: List[str], seen: Set[str]) -> None:
+def _suggest_from_workflows(
+    root: Path, entries: Set[str], suggestions: List[str], seen: Set[str]
+) -> None:
+    if ".github" not in entries:
+        return
     workflows_dir = root / ".github" / "workflows"
     if not workflows_dir.exists():
         return
 
+    # One scandir pass replaces the pair of globs that each walked the
+    # directory and allocated Path objects per entry.
     workflow_paths = sorted(
-        [
-            *workflows_dir.glob("*.yml"),
-            *workflows_dir.glob("*.yaml"),
-        ]
+        entry.path
+        for entry in os.scandir(workflows_dir)
+        if entry.is_file() and entry.name.endswith((".yml", ".yaml"))
     )
-    run_line = re.compile(r"^\s*run:\s*(.*)$")
-
+    # Stream each workflow line by line instead of materializing the whole
+    # file as a list; block_indent tracks whether we are inside a multi-line
+    # run block.
     for path in workflow_paths:
-        lines = path.read_text().splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            m = run_line.match(line)
-            if not m:
-                i += 1
-                continue
-
-            rest = m.group(1).strip()
-            if rest and rest not in ("|", ">"):
-                if _is_test_command(rest):
-                    _add_suggestion(rest, suggestions, seen)
-                i += 1
-                continue
-
-            # Handle multi-line run blocks.
-            base_indent = len(line) - len(line.lstrip(" "))
-            i += 1
-            while i < len(lines):
-                block_line = lines[i]
-                indent = len(block_line) - len(block_line.lstrip(" "))
-                if indent <= base_indent:
-                    break
-                cmd = block_line.strip()
-                if cmd and _is_test_command(cmd):
-                    _add_suggestion(cmd, suggestions, seen)
-                i += 1
+        with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+            block_indent: Optional[int] = None
+            for raw in fh:
+                line = raw.rstrip("\n")
+                if block_indent is not None:
+                    indent = len(line) - len(line.lstrip(" "))
+                    if indent > block_indent:
+                        cmd = line.strip()
+                        if cmd and _is_test_command(cmd):
+                            _add_suggestion(cmd, suggestions, seen)
+                        continue
+                    # The block ended; scan this line normally below.
+                    block_indent = None
+
+                m = _RUN_LINE_RE.match(line)
+                if not m:
+                    continue
+                rest = m.group(1).strip()
+                if rest and rest not in ("|", ">"):
+                    if _is_test_command(rest):
+                        _add_suggestion(rest, suggestions, seen)
+                else:
+                    block_indent = len(line) - len(line.lstrip(" "))
 
 
 def suggest_test_commands(root: Path, *, prior: Sequence[str] = ()) -> List[str]:
@@ -560,16 +932,51 @@ def suggest_test_commands(root: Path, *, prior: Sequence[str] = ()) -> List[str]
     for cmd in prior:
         _add_suggestion(cmd, suggestions, seen)
 
-    _suggest_from_justfile(root, suggestions, seen)
-    _suggest_from_makefile(root, suggestions, seen)
-    _suggest_from_package_json(root, suggestions, seen)
-    _suggest_from_python_project(root, suggestions, seen)
-    _suggest_from_other_roots(root, suggestions, seen)
-    _suggest_from_workflows(root, suggestions, seen)
+    # One readdir snapshot of the root replaces the dozen-plus stat() probes
+    # the suggesters would otherwise make for their marker files.
+    try:
+        entries = {entry.name for entry in os.scandir(root)}
+    except OSError:
+        entries = set()
+
+    _suggest_from_justfile(root, entries, suggestions, seen)
+    _suggest_from_makefile(root, entries, suggestions, seen)
+    _suggest_from_package_json(root, entries, suggestions, seen)
+    _suggest_from_python_project(root, entries, suggestions, seen)
+    _suggest_from_other_roots(root, entries, suggestions, seen)
+    _suggest_from_workflows(root, entries, suggestions, seen)
 
     return suggestions
 
 
+class _LazyList:
+    """List stand-in whose contents are computed on first access.
+
+    Callers of ``discover_test_command`` that only read ``command`` never pay
+    for the filesystem suggestion scan behind ``suggestions``.
+    """
+
+    def __init__(self, factory: Callable[[], List[str]]) -> None:
+        self._factory: Optional[Callable[[], List[str]]] = factory
+        self._items: Optional[List[str]] = None
+
+    def _materialize(self) -> List[str]:
+        if self._items is None:
+            assert self._factory is not None
+            self._items = self._factory()
+            self._factory = None
+        return self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+
 def discover_test_command(preferred: str = "") -> Dict[str, object]:
     """Discover a repo-specific test command and return diagnostics.
 
@@ -609,11 +1016,12 @@ def discover_test_command(preferred: str = "") -> Dict[str, object]:
     else:
         reason = "agents-ambiguous"
 
-    suggestions = suggest_test_commands(root, prior=agents_candidates)
     return {
         "command": None,
         "source": "none",
         "reason": reason,
         "candidates": agents_candidates,
-        "suggestions": suggestions,
+        "suggestions": _LazyList(
+            lambda: suggest_test_commands(root, prior=agents_candidates)
+        ),
     }
@@ -3,22 +3,24 @@
 
 from __future__ import annotations
 
+import difflib
 import os
+import subprocess
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterator, Optional
+from typing import IO, Dict, Iterator, Optional
 
 from command_argv import display_argv, execute_argv, validate_argv
 from common import (
     CommandError,
     branch_name_for,
     checkout_restore,
+    collect_repo_state,
     current_branch,
     delete_branch,
     ensure_branches_exist,
     ensure_clean_tree,
-    ensure_git_repo,
     git,
     is_path_ignored,
     repo_root,
@@ -40,20 +42,18 @@ def bounded_diagnostic(value: str) -> str:
     )
 
 
-def write_restricted_text(path: Path, value: str) -> None:
-    """Write one raw comparison output with owner-only permissions."""
+def open_restricted(path: Path) -> IO[bytes]:
+    """Open one raw comparison output for writing with owner-only permissions."""
 
     flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
     flags |= getattr(os, "O_NOFOLLOW", 0)
     descriptor = os.open(path, flags, 0o600)
     try:
         os.fchmod(descriptor, 0o600)
-        with os.fdopen(descriptor, "w") as stream:
-            descriptor = -1
-            stream.write(value)
-    finally:
-        if descriptor >= 0:
-            os.close(descriptor)
+        return os.fdopen(descriptor, "wb")
+    except Exception:
+        os.close(descriptor)
+        raise
 
 
 def resolve_keep_output_dir(destination: Path) -> Path:
@@ -101,14 +101,43 @@ def comparison_workspace(keep_output_dir: Optional[Path]) -> Iterator[Path]:
 
 def run_capture(argv: object, outfile: Path) -> None:
     approved_argv = validate_argv(argv, label="database command argv")
-    result = execute_argv(approved_argv, text=True, capture_output=True)
+    # Stdout streams straight into the restricted file, so a large dump never
+    # accumulates in Python memory; only stderr is captured for diagnostics.
+    with open_restricted(outfile) as stream:
+        result = execute_argv(
+            approved_argv, text=True, stdout=stream, stderr=subprocess.PIPE
+        )
     if result.returncode != 0:
-        detail = bounded_diagnostic(result.stderr or result.stdout or "")
+        detail = (result.stderr or "").strip()
+        if not detail:
+            with outfile.open("r", errors="replace") as captured:
+                detail = captured.read(DIAGNOSTIC_LIMIT + 200)
+        detail = bounded_diagnostic(detail)
         message = f"Command failed ({result.returncode}): {display_argv(approved_argv)}"
         if detail:
             message += f"\n{detail}"
         raise CommandError(message)
-    write_restricted_text(outfile, result.stdout)
+
+
+def compare_outputs(source_out: Path, chain_out: Path) -> None:
+    """Compare two captured outputs in-process and report the result."""
+
+    # A byte comparison settles the common equal case without a subprocess;
+    # only a mismatch pays for building a diff.
+    source_bytes = source_out.read_bytes()
+    chain_bytes = chain_out.read_bytes()
+    if source_bytes == chain_bytes:
+        print("[OK] No differences detected.")
+        return
+    diff_text = "".join(
+        difflib.unified_diff(
+            source_bytes.decode("utf-8", "replace").splitlines(keepends=True),
+            chain_bytes.decode("utf-8", "replace").splitlines(keepends=True),
+            fromfile=str(source_out),
+            tofile=str(chain_out),
+        )
+    )
+    print(bounded_diagnostic(diff_text) or "[WARN] Differences detected.")
 
 
 def db_compare(
@@ -123,8 +152,9 @@ def db_compare(
     )
     approved_chain_argv = validate_argv(chain_argv, label="approved chain schema argv")
 
-    ensure_git_repo()
-    ensure_clean_tree()
+    # One status snapshot answers both the repo probe and the clean check.
+    state = collect_repo_state()
+    ensure_clean_tree(state)
 
     base = plan["base_branch"]
     source = plan["source_branch"]
@@ -146,35 +176,24 @@ def db_compare(
                 run_capture(approved_source_argv, source_out)
 
                 git("checkout", "-B", temp_branch, base)
-                for name in chain:
-                    print(f"[STEP] Merging {name} into {temp_branch}")
-                    git("merge", "--no-ff", "--no-edit", name)
+                # One octopus merge assembles the whole chain in a single git
+                # invocation; it refuses any conflict, so fall back to the
+                # per-branch sequence when it cannot complete.
+                print(f"[STEP] Merging {len(chain)} chain branch(es) into {temp_branch}")
+                octopus = git("merge", "--no-ff", "--no-edit", *chain, check=False)
+                if octopus.returncode != 0:
+                    git("merge", "--abort", check=False)
+                    print("[INFO] Octopus merge failed, falling back to sequential")
+                    git("checkout", "-B", temp_branch, base)
+                    for name in chain:
+                        print(f"[STEP] Merging {name} into {temp_branch}")
+                        git("merge", "--no-ff", "--no-edit", name)
 
                 print(f"[STEP] Running chain command on {temp_branch}")
                 run_capture(approved_chain_argv, chain_out)
 
-                print("[STEP] Diffing outputs (git diff --no-index)")
-                diff = git(
-                    "diff",
-                    "--no-index",
-                    "--",
-                    str(source_out),
-                    str(chain_out),
-                    check=False,
-                )
-                if diff.returncode == 0:
-                    print("[OK] No differences detected.")
-                elif diff.returncode == 1:
-                    print(
-                        bounded_diagnostic(diff.stdout)
-                        or "[WARN] Differences detected."
-                    )
-                else:
-                    detail = bounded_diagnostic(diff.stderr or diff.stdout)
-                    message = f"Database output comparison failed ({diff.returncode})."
-                    if detail:
-                        message += f"\n{detail}"
-                    raise CommandError(message)
+                print("[STEP] Diffing outputs")
+                compare_outputs(source_out, chain_out)
         finally:
             if current_branch() != original:
                 git("checkout", original)
@@ -8,7 +8,7 @@ import json
 import sys
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, List, Optional, Sequence
 
 SCRIPTS_DIR = Path(__file__).resolve().parents[1]
 if str(SCRIPTS_DIR) not in sys.path:
@@ -23,6 +23,7 @@ from common import (  # noqa: E402
     ensure_clean_tree,
     git,
     load_plan,
+    resolve_objects,
     validate_plan,
 )
 from metadata import SourceIdentity, parse_commit_message  # noqa: E402
@@ -54,23 +55,29 @@ def _validate_plan(plan: Dict, checks: List[str], failures: List[str]) -> None:
 
 
 def _check_source_hash(
-    source_branch: str, expected: str, checks: List[str], failures: List[str]
+    source_branch: str,
+    expected: str,
+    resolved: Dict[str, Optional[str]],
+    checks: List[str],
+    failures: List[str],
 ) -> None:
-    current = git("rev-parse", source_branch).stdout.strip()
+    current = resolved.get(source_branch) or ""
     if current == expected:
         checks.append("source_hash_unchanged")
     else:
         failures.append(f"source_hash_unchanged: expected {expected}, got {current}")
 
 
-def _check_chain_exists(plan: Dict, checks: List[str], failures: List[str]) -> None:
+def _check_chain_exists(
+    plan: Dict,
+    resolved: Dict[str, Optional[str]],
+    checks: List[str],
+    failures: List[str],
+) -> None:
     source = plan["source_branch"]
     total = len(plan["changesets"])
-    missing: List[str] = []
-    for i in range(1, total + 1):
-        name = branch_name_for(source, i)
-        if git("rev-parse", "--verify", name, check=False).returncode != 0:
-            missing.append(name)
+    names = [branch_name_for(source, i) for i in range(1, total + 1)]
+    missing = [name for name in names if resolved.get(name) is None]
     if missing:
         failures.append("chain_exists: missing " + ", ".join(missing))
     else:
@@ -101,13 +108,19 @@ def _check_validate_chain(
 
 
 def _check_successor_recovery_metadata(
-    plan: Dict, checks: List[str], failures: List[str]
+    plan: Dict,
+    resolved: Dict[str, Optional[str]],
+    checks: List[str],
+    failures: List[str],
 ) -> None:
     """Exercise the real recovery metadata transition without remote mutation."""
     source = plan["source_branch"]
     index = len(plan["changesets"])
     branch = branch_name_for(source, index)
-    head = git("rev-parse", branch).stdout.strip()
+    head = resolved.get(branch)
+    if head is None:
+        failures.append(f"successor_recovery_metadata: missing branch {branch}")
+        return
     try:
         current = parse_commit_message(git("show", "-s", "--format=%B", head).stdout)
         successor = SourceIdentity(f"{source}-successor", current.source_sha)
@@ -157,7 +170,6 @@ def grade_repo(
         return GradeResult(ok=False, checks=checks, failures=failures)
 
     _validate_plan(plan, checks, failures)
-    _check_source_hash(plan["source_branch"], expected_source_hash, checks, failures)
 
     if auto_create_chain:
         try:
@@ -166,10 +178,19 @@ def grade_repo(
         except CommandError as exc:
             failures.append(f"create_chain: {exc}")
 
-    _check_chain_exists(plan, checks, failures)
+    # One batched resolution after any chain creation feeds every ref-based
+    # check; no per-check rev-parse spawns remain.
+    source = plan["source_branch"]
+    chain_names = [
+        branch_name_for(source, i) for i in range(1, len(plan["changesets"]) + 1)
+    ]
+    resolved = resolve_objects([source, *chain_names])
+
+    _check_source_hash(source, expected_source_hash, resolved, checks, failures)
+    _check_chain_exists(plan, resolved, checks, failures)
     _check_equivalence(plan, checks, failures)
     _check_validate_chain(plan, test_argv=test_argv, checks=checks, failures=failures)
-    _check_successor_recovery_metadata(plan, checks, failures)
+    _check_successor_recovery_metadata(plan, resolved, checks, failures)
 
     return GradeResult(ok=not failures, checks=checks, failures=failures)
 
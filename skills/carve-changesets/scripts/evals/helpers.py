@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
 import tempfile
@@ -17,11 +18,11 @@ def run(cmd: list[str], *, cwd: Path) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, cwd=cwd, text=True, capture_output=True, check=True)
 
 
-def commit(cwd: Path, message: str) -> None:
-    with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8") as message_file:
-        message_file.write(message + "\n")
-        message_file.flush()
-        run(["git", "commit", "-F", message_file.name], cwd=cwd)
+def run_script(script: str, *, cwd: Path) -> subprocess.CompletedProcess:
+    """Run several fixed git commands in one shell to avoid per-call execs."""
+    return subprocess.run(
+        ["/bin/sh", "-ec", script], cwd=cwd, text=True, capture_output=True, check=True
+    )
 
 
 def write_plan(plan_path: Path, plan: Dict) -> None:
@@ -33,24 +34,26 @@ def init_eval_repo() -> Tuple[Path, Dict, str]:
     """Create a temporary repo with a known base/source and plan."""
     repo_dir = Path(tempfile.mkdtemp(prefix="pcs-eval-repo-"))
 
-    run(["git", "init", "-b", "main"], cwd=repo_dir)
-    run(["git", "config", "user.name", "PCS Eval"], cwd=repo_dir)
-    run(["git", "config", "user.email", "pcs-eval@example.com"], cwd=repo_dir)
-
     # Keep eval artifacts out of git status checks.
     (repo_dir / ".gitignore").write_text(".carve-changesets/\n")
 
     (repo_dir / "a.txt").write_text("base-a\n")
     (repo_dir / "b.txt").write_text("base-b\n")
-    run(["git", "add", "-A"], cwd=repo_dir)
-    commit(repo_dir, "base")
+    # Fixture setup is a fixed command sequence; one shell per commit phase
+    # replaces eight separate subprocess spawns.
+    run_script(
+        "git init -b main"
+        " && git config user.name 'PCS Eval'"
+        " && git config user.email pcs-eval@example.com"
+        " && git add -A && git commit -m base"
+        " && git checkout -b feature/test",
+        cwd=repo_dir,
+    )
 
-    run(["git", "checkout", "-b", "feature/test"], cwd=repo_dir)
     (repo_dir / "a.txt").write_text("feature-a\n")
     (repo_dir / "b.txt").write_text("feature-b\n")
     (repo_dir / "c.txt").write_text("feature-c\n")
-    run(["git", "add", "-A"], cwd=repo_dir)
-    commit(repo_dir, "feature")
+    run_script("git add -A && git commit -m feature", cwd=repo_dir)
 
     plan: Dict = {
         "feature_title": "Eval feature",
@@ -87,4 +90,12 @@ def init_eval_repo() -> Tuple[Path, Dict, str]:
 
 
 def cleanup_repo(repo_dir: Path) -> None:
+    # One rm fork walks the .git object tree kernel-side instead of one
+    # scandir+unlink round trip per entry from Python.
+    if os.name == "posix":
+        result = subprocess.run(
+            ["rm", "-rf", "--", str(repo_dir)], check=False, capture_output=True
+        )
+        if result.returncode == 0:
+            return
     shutil.rmtree(repo_dir)
@@ -9,6 +9,7 @@ import os
 import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 THIS_DIR = Path(__file__).resolve().parent
@@ -104,17 +105,23 @@ def grade_forward(case_id: str, observed: dict, expected: dict) -> list[str]:
 
 
 def evaluate_forward(
-    cases_path: Path, expectations_path: Path, command: list[str]
+    cases_path: Path, expectations_path: Path, command: list[str], *, jobs: int = 1
 ) -> tuple[dict[str, dict], list[str]]:
     cases = load_json(cases_path)
     expectations = {item["case_id"]: item for item in load_json(expectations_path)}
     if {case["id"] for case in cases} != set(expectations):
         raise ValueError("forward case and expectation IDs differ")
 
+    # Each case is one isolated executor subprocess, so cases can run
+    # concurrently; observations and failures stay in case order.
+    payloads = [build_payload(case) for case in cases]
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(cases) or 1))) as pool:
+        futures = [pool.submit(run_executor, command, payload) for payload in payloads]
+        observed_results = [future.result() for future in futures]
+
     observations: dict[str, dict] = {}
     failures: list[str] = []
-    for case in cases:
-        observed = run_executor(command, build_payload(case))
+    for case, observed in zip(cases, observed_results):
         observations[case["id"]] = observed
         failures.extend(grade_forward(case["id"], observed, expectations[case["id"]]))
     return observations, failures
@@ -154,14 +161,26 @@ def evaluate_integration(cases_path: Path, *, test_argv: list[str]) -> dict[str,
     }
 
 
-def write_outputs(output_dir: Path | None, results: dict[str, dict]) -> None:
+def write_outputs(
+    output_dir: Path | None,
+    results: dict[str, dict],
+    failed_ids: set[str],
+    summary_blob: str,
+) -> None:
     if output_dir is None:
         return
     output_dir.mkdir(parents=True, exist_ok=True)
-    for case_id, result in results.items():
+    # The summary already carries every outcome; per-case files exist for
+    # debugging, so only failing cases earn one.
+    for case_id in sorted(failed_ids & set(results)):
         (output_dir / f"{case_id}.json").write_text(
-            json.dumps(result, indent=2, sort_keys=True) + "\n"
+            json.dumps(results[case_id], indent=2, sort_keys=True) + "\n"
         )
+    # Write-then-rename so an interrupted run never leaves a torn summary.
+    summary_path = output_dir / "summary.json"
+    tmp_path = summary_path.with_name(summary_path.name + ".tmp")
+    tmp_path.write_text(summary_blob + "\n")
+    os.replace(tmp_path, summary_path)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -193,6 +212,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help=argparse.SUPPRESS,
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Concurrent forward cases (integration self-test is always serial)",
+    )
     parser.add_argument("--output-dir", type=Path)
     return parser
 
@@ -217,11 +242,13 @@ def main(argv: list[str] | None = None) -> int:
         mode = "integration_self_test"
     else:
         results, failures = evaluate_forward(
-            args.cases, args.expectations, shlex.split(args.executor)
+            args.cases,
+            args.expectations,
+            shlex.split(args.executor),
+            jobs=args.jobs,
         )
         mode = "forward"
 
-    write_outputs(args.output_dir, results)
     failed_ids = {item.split(":", 1)[0] for item in failures}
     summary = {
         "mode": mode,
@@ -230,7 +257,10 @@ def main(argv: list[str] | None = None) -> int:
         "failed": len(failed_ids),
         "failures": failures,
     }
-    print(json.dumps(summary, indent=2, sort_keys=True))
+    # Serialize once and reuse for both the on-disk summary and stdout.
+    summary_blob = json.dumps(summary, indent=2, sort_keys=True)
+    write_outputs(args.output_dir, results, failed_ids, summary_blob)
+    print(summary_blob)
     return 1 if failures else 0
 
 
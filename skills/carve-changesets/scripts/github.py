@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import shlex
 import subprocess
-from typing import Dict, Iterable, List, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 from urllib.parse import urlparse
 
 from common import (
@@ -117,40 +120,57 @@ def github_repo_for_remote(remote: str) -> str:
     return f"{host.lower()}/{owner}/{repo}"
 
 
-def ensure_gh_ready(repository: str) -> None:
-    host = repository.split("/", 1)[0]
+@functools.lru_cache(maxsize=None)
+def _gh_auth_checked(host: str) -> None:
     gh_capture(("auth", "status", "--hostname", host))
 
 
+def ensure_gh_ready(repository: str) -> None:
+    # `gh auth status` is a multi-hundred-millisecond probe; one success per
+    # host is enough for the life of the process. A failure raises and is not
+    # cached, so retries still re-probe.
+    _gh_auth_checked(repository.split("/", 1)[0])
+
+
 def pr_title_for(feature_title: str, index: int, total: int) -> str:
     return f"{feature_title} ({index} of {total})"
 
 
+def pr_body_builder(plan: Dict) -> Callable[[int, int, Dict], str]:
+    """Return a PR body builder with the plan-level text prepared once."""
+
+    feature_title = plan["feature_title"].strip()
+    source = plan["source_branch"]
+
+    def build(index: int, total: int, changeset: Dict) -> str:
+        notes = changeset.get("pr_notes", []) or []
+        if notes and all(isinstance(note, str) and note.strip() for note in notes):
+            notes_block = "\n".join(f"- {note.strip()}" for note in notes)
+        else:
+            notes_block = "- None documented."
+        description = (
+            str(changeset.get("description", "")).strip()
+            or "Describe the intent of this changeset."
+        )
+        body = (
+            f"## Overall Feature\n{feature_title}\n\n"
+            f"## This Changeset ({index} of {total})\n{description}\n\n"
+            f"## Scaffolding, Flags, And Intentional Incompleteness\n{notes_block}"
+        )
+        message = git(
+            "show", "-s", "--format=%B", branch_name_for(source, index)
+        ).stdout
+        return embed_pr_metadata(body.strip() + "\n", parse_commit_message(message))
+
+    return build
+
+
 def pr_body_for(plan: Dict, index: int, total: int, changeset: Dict) -> str:
-    notes = changeset.get("pr_notes", []) or []
-    lines = [
-        "## Overall Feature",
-        plan["feature_title"].strip(),
-        "",
-        f"## This Changeset ({index} of {total})",
-        str(changeset.get("description", "")).strip()
-        or "Describe the intent of this changeset.",
-        "",
-        "## Scaffolding, Flags, And Intentional Incompleteness",
-    ]
-    if notes and all(isinstance(note, str) and note.strip() for note in notes):
-        lines.extend(f"- {note.strip()}" for note in notes)
-    else:
-        lines.append("- None documented.")
-    branch = branch_name_for(plan["source_branch"], index)
-    message = git("show", "-s", "--format=%B", branch).stdout
-    return embed_pr_metadata(
-        "\n".join(lines).strip() + "\n", parse_commit_message(message)
-    )
+    return pr_body_builder(plan)(index, total, changeset)
 
 
 def _print_command(command: Sequence[str]) -> None:
-    print(" ".join(subprocess.list2cmdline([part]) for part in command))
+    print(shlex.join(command))
 
 
 def _local_remote_head(branch: str, remote: str) -> str:
@@ -217,8 +237,59 @@ def _verify_created_pr(
     return created
 
 
+def _create_one_pr(
+    *,
+    repository: str,
+    head: str,
+    pr_base: str,
+    title: str,
+    body: str,
+    expected_head: str,
+    expected_metadata: ChangesetMetadata,
+) -> Dict:
+    with message_file(body) as body_path:
+        gh_capture(
+            (
+                "pr",
+                "create",
+                "-R",
+                repository,
+                "--base",
+                pr_base,
+                "--head",
+                head,
+                "--title",
+                title,
+                "--body-file",
+                body_path,
+            )
+        )
+    return _verify_created_pr(
+        gh_json(
+            (
+                "pr",
+                "view",
+                head,
+                "-R",
+                repository,
+                "--json",
+                "number,url,headRefOid,baseRefName,body",
+            )
+        ),
+        head=head,
+        expected_head=expected_head,
+        expected_base=pr_base,
+        expected_metadata=expected_metadata,
+    )
+
+
 def pr_create(
-    plan: Dict, *, indices: List[int], dry_run: bool, remote: str = "origin"
+    plan: Dict,
+    *,
+    indices: Sequence[int],
+    dry_run: bool,
+    remote: str = "origin",
+    max_workers: int = 4,
 ) -> None:
     ensure_git_repo()
     ensure_clean_tree()
@@ -243,57 +314,73 @@ def pr_create(
         if not dry_run
         else {}
     )
+    # Everything git-local is prepared up front so the only work left per PR
+    # is the pair of gh network round-trips.
+    body_for = pr_body_builder(plan)
+    jobs: List[Dict] = []
     for index in indices:
         head = branch_name_for(source, index)
         pr_base = base_for_changeset(base, source, index)
         title = pr_title_for(plan["feature_title"], index, total)
-        body = pr_body_for(plan, index, total, changesets[index - 1])
-        expected_metadata = parse_commit_message(
-            git("show", "-s", "--format=%B", head).stdout
-        )
-        with message_file(body) as body_path:
-            args = (
-                "pr",
-                "create",
-                "-R",
-                repository,
-                "--base",
-                pr_base,
-                "--head",
-                head,
-                "--title",
-                title,
-                "--body-file",
-                body_path,
-            )
-            print(f"[STEP] PR for changeset {index}: {head} -> {pr_base}")
-            if dry_run:
-                print("[DRY-RUN] Would run:")
-                _print_command(("gh", *args))
-                continue
-            expected_head = expected_heads[head]
-            gh_capture(args)
-        created = _verify_created_pr(
-            gh_json(
-                (
-                    "pr",
-                    "view",
-                    head,
-                    "-R",
-                    repository,
-                    "--json",
-                    "number,url,headRefOid,baseRefName,body",
+        body = body_for(index, total, changesets[index - 1])
+        print(f"[STEP] PR for changeset {index}: {head} -> {pr_base}")
+        if dry_run:
+            print("[DRY-RUN] Would run:")
+            with message_file(body) as body_path:
+                _print_command(
+                    (
+                        "gh",
+                        "pr",
+                        "create",
+                        "-R",
+                        repository,
+                        "--base",
+                        pr_base,
+                        "--head",
+                        head,
+                        "--title",
+                        title,
+                        "--body-file",
+                        body_path,
+                    )
                 )
-            ),
-            head=head,
-            expected_head=expected_head,
-            expected_base=pr_base,
-            expected_metadata=expected_metadata,
+            continue
+        jobs.append(
+            {
+                "repository": repository,
+                "head": head,
+                "pr_base": pr_base,
+                "title": title,
+                "body": body,
+                "expected_head": expected_heads[head],
+                "expected_metadata": parse_commit_message(
+                    git("show", "-s", "--format=%B", head).stdout
+                ),
+            }
         )
-        print(f"[OK] PR #{created['number']} created: {created['url']}")
 
     if dry_run:
         print("[OK] Dry-run complete. Re-run with --no-dry-run to execute.")
+        return
+
+    # Each PR is an independent network round-trip; a small thread pool
+    # overlaps the gh latency while results print in changeset order. A
+    # failure does not cancel the siblings: every PR either lands and is
+    # verified or reports its own error, and the first error is re-raised
+    # once all of them have settled.
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as pool:
+        futures = [pool.submit(_create_one_pr, **job) for job in jobs]
+        first_error: Optional[CommandError] = None
+        for job, future in zip(jobs, futures):
+            try:
+                created = future.result()
+                print(f"[OK] PR #{created['number']} created: {created['url']}")
+            except CommandError as exc:
+                print(f"[ERROR] PR for {job['head']}: {exc}")
+                if first_error is None:
+                    first_error = exc
+        if first_error is not None:
+            raise first_error
 
 
 def pull_requests_for_source(
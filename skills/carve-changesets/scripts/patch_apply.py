@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-import fnmatch
-import tempfile
+import functools
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from common import CommandError, git, repo_root
+from common import CommandError, compile_globs, git, repo_root
 
 
 @dataclass(frozen=True)
@@ -26,25 +26,28 @@ class HunkSelector:
 @dataclass
 class Hunk:
     header: str
-    lines: List[str]
-
-    @property
-    def body_lines(self) -> List[str]:
-        return self.lines[1:]
+    text: str
+    _body_text: Optional[str] = field(default=None, repr=False, compare=False)
 
     @property
     def body_text(self) -> str:
-        return "\n".join(self.body_lines)
+        # Filters probe the body repeatedly (contains, then excludes, often
+        # across several selectors); derive it from the slice once and keep
+        # the result.
+        if self._body_text is None:
+            parts = self.text.split("\n", 1)
+            self._body_text = parts[1].removesuffix("\n") if len(parts) > 1 else ""
+        return self._body_text
 
 
 @dataclass
 class DiffFile:
     old_path: Optional[str]
     new_path: Optional[str]
-    header_lines: List[str]
+    header_text: str
     hunks: List[Hunk] = field(default_factory=list)
     is_binary: bool = False
-    binary_lines: List[str] = field(default_factory=list)
+    binary_text: str = ""
 
 
 @dataclass
@@ -67,8 +70,22 @@ def _file_label(df: DiffFile) -> str:
     return df.new_path or df.old_path or "<unknown>"
 
 
+@functools.lru_cache(maxsize=None)
+def _excludes_re(excludes: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile a selector's excludes into one alternation, or None if empty.
+
+    One compiled scan finds any forbidden substring in a body instead of one
+    substring pass per pattern; "contains" needs every pattern present, so
+    per-pattern membership remains the right shape there.
+    """
+    if not excludes:
+        return None
+    return re.compile("|".join(re.escape(value) for value in excludes))
+
+
 def _matches_any(path: str, patterns: Iterable[str]) -> bool:
-    return any(fnmatch.fnmatch(path, pat) for pat in patterns)
+    compiled = compile_globs(tuple(patterns))
+    return compiled is not None and compiled.match(path) is not None
 
 
 def parse_hunk_selectors(
@@ -138,55 +155,46 @@ def parse_hunk_selectors(
     return parsed
 
 
+# Every section of a unified diff opens at one of these line starts; one
+# C-level scan for the anchors replaces a Python-level startswith dispatch
+# per line, which dominates parsing for very large diffs.
+_DIFF_ANCHOR_RE = re.compile(r"(?m)^(?:diff --git |@@ |GIT binary patch)")
+
+
+def _first_line(section: str) -> str:
+    newline = section.find("\n")
+    return section if newline < 0 else section[:newline]
+
+
 def parse_unified_diff(diff_text: str) -> List[DiffFile]:
-    lines = diff_text.splitlines()
+    # Each section stays one slice of the original buffer; lines are never
+    # materialized individually, so selection later reassembles patches with
+    # a few large copies instead of millions of small ones.
     files: List[DiffFile] = []
     current: Optional[DiffFile] = None
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith("diff --git "):
+    anchors = _DIFF_ANCHOR_RE.finditer(diff_text)
+    starts = [match.start() for match in anchors]
+    starts.append(len(diff_text))
+    for pos in range(len(starts) - 1):
+        section = diff_text[starts[pos] : starts[pos + 1]]
+        if section.startswith("diff --git "):
             if current:
                 files.append(current)
-            parts = line.split(" ")
+            parts = _first_line(section).split(" ")
             old_path = _strip_prefix(parts[2]) if len(parts) > 2 else None
             new_path = _strip_prefix(parts[3]) if len(parts) > 3 else None
             current = DiffFile(
                 old_path=old_path,
                 new_path=new_path,
-                header_lines=[line],
+                header_text=section,
             )
-            i += 1
-            continue
-
-        if current is None:
-            i += 1
+        elif current is None:
             continue
-
-        if line.startswith("GIT binary patch"):
+        elif section.startswith("GIT binary patch"):
             current.is_binary = True
-            while i < len(lines):
-                line = lines[i]
-                if line.startswith("diff --git "):
-                    break
-                current.binary_lines.append(line)
-                i += 1
-            continue
-
-        if line.startswith("@@ "):
-            hunk_lines = [line]
-            i += 1
-            while i < len(lines):
-                line = lines[i]
-                if line.startswith("diff --git ") or line.startswith("@@ "):
-                    break
-                hunk_lines.append(line)
-                i += 1
-            current.hunks.append(Hunk(header=hunk_lines[0], lines=hunk_lines))
-            continue
-
-        current.header_lines.append(line)
-        i += 1
+            current.binary_text += section
+        else:
+            current.hunks.append(Hunk(header=_first_line(section), text=section))
 
     if current:
         files.append(current)
@@ -194,31 +202,93 @@ def parse_unified_diff(diff_text: str) -> List[DiffFile]:
     return files
 
 
+@functools.lru_cache(maxsize=4)
+def _build_diff_cached(base_sha: str, source_sha: str) -> Tuple[DiffFile, ...]:
+    diff = git(
+        "diff",
+        "--binary",
+        "--full-index",
+        "--find-renames=20%",
+        f"{base_sha}..{source_sha}",
+    ).stdout
+    return tuple(parse_unified_diff(diff))
+
+
 def build_diff(base: str, source: str) -> List[DiffFile]:
+    """Build (or reuse) the parsed base..source diff.
+
+    The cache is keyed on resolved SHAs rather than ref names, so a ref that
+    moves mid-run can never serve a stale parse; commands that diff the same
+    pair repeatedly (strict validation, hunk selection) pay for one diff.
+    """
+    base_sha = git("rev-parse", base).stdout.strip()
+    source_sha = git("rev-parse", source).stdout.strip()
+    return list(_build_diff_cached(base_sha, source_sha))
+
+
+def _rename_sides(base: str, source: str, path: str) -> Tuple[str, ...]:
+    """Return the pathspec covering both rename sides of one file.
+
+    A content diff scoped to a single side of a rename degrades to a bare
+    deletion (old path) or addition (new path), hiding the rename hunks the
+    full diff contains. A name-status pass carries no hunk content, so
+    resolving the counterpart first stays cheap even on a large branch; the
+    rename threshold matches the content diff so both agree on what is a
+    rename.
+    """
+    raw = git(
+        "diff", "--name-status", "-z", "--find-renames=20%", f"{base}..{source}"
+    ).stdout
+    tokens = raw.split("\0")
+    total = len(tokens)
+    i = 0
+    while i < total:
+        status = tokens[i]
+        if not status:
+            i += 1
+            continue
+        if status[0] in ("R", "C") and i + 2 < total:
+            if path in (tokens[i + 1], tokens[i + 2]):
+                return (tokens[i + 1], tokens[i + 2])
+            i += 3
+        else:
+            i += 2
+    return (path,)
+
+
+def build_diff_for_path(base: str, source: str, path: str) -> List[DiffFile]:
+    """Parse only the base..source diff entries touching one path.
+
+    Scoping the diff to a pathspec keeps the work O(one file) instead of
+    materializing and parsing every hunk in the full diff; previews of a
+    single file in a large branch read only what they show. If the path is
+    either side of a rename, the diff is scoped to both sides so the entry
+    parses as the same rename the full diff would show.
+    """
     diff = git(
         "diff",
         "--binary",
         "--full-index",
         "--find-renames=20%",
         f"{base}..{source}",
+        "--",
+        *_rename_sides(base, source, path),
     ).stdout
     return parse_unified_diff(diff)
 
 
 def _selectors_for_file(
-    selectors: Sequence[HunkSelector], df: DiffFile
+    by_file: Dict[str, List[HunkSelector]], df: DiffFile
 ) -> List[HunkSelector]:
-    label = _file_label(df)
+    # Three dict lookups replace a scan over every selector; a selector whose
+    # file names both the label and a rename side is returned once.
     matched: List[HunkSelector] = []
-    for selector in selectors:
-        if selector.file == label:
-            matched.append(selector)
-            continue
-        if df.old_path and selector.file == df.old_path:
-            matched.append(selector)
-            continue
-        if df.new_path and selector.file == df.new_path:
-            matched.append(selector)
+    seen: set = set()
+    for key in (_file_label(df), df.old_path, df.new_path):
+        for selector in by_file.get(key, ()) if key else ():
+            if id(selector) not in seen:
+                seen.add(id(selector))
+                matched.append(selector)
     return matched
 
 
@@ -234,13 +304,16 @@ def select_hunks_for_changeset(
     if not selectors:
         raise CommandError(f"{changeset_label}: hunk_selectors must be non-empty.")
 
-    patch_lines: List[str] = []
+    patch_parts: List[str] = []
     selected_files: List[str] = []
     selected_hunks = 0
     seen_selectors = {id(selector): False for selector in selectors}
+    by_file: Dict[str, List[HunkSelector]] = {}
+    for selector in selectors:
+        by_file.setdefault(selector.file, []).append(selector)
 
     for df in diff_files:
-        file_selectors = _selectors_for_file(selectors, df)
+        file_selectors = _selectors_for_file(by_file, df)
         if not file_selectors:
             continue
 
@@ -291,6 +364,7 @@ def select_hunks_for_changeset(
                     raise CommandError(
                         f"{changeset_label}: selector file {selector.file} is excluded by exclude_paths."
                     )
+                excludes_re = _excludes_re(selector.excludes)
                 candidates: List[Hunk] = []
                 for hunk in df.hunks:
                     if (
@@ -303,7 +377,7 @@ def select_hunks_for_changeset(
                         c in body for c in selector.contains
                     ):
                         continue
-                    if selector.excludes and any(c in body for c in selector.excludes):
+                    if excludes_re is not None and excludes_re.search(body):
                         continue
                     candidates.append(hunk)
 
@@ -336,9 +410,8 @@ def select_hunks_for_changeset(
             )
 
         if chosen:
-            patch_lines.extend(df.header_lines)
-            for hunk in chosen:
-                patch_lines.extend(hunk.lines)
+            patch_parts.append(df.header_text)
+            patch_parts.extend(hunk.text for hunk in chosen)
             selected_files.append(label)
             selected_hunks += len(chosen)
 
@@ -352,7 +425,11 @@ def select_hunks_for_changeset(
     if not selected_files:
         raise CommandError(f"{changeset_label}: no hunks selected for this changeset.")
 
-    patch_text = "\n".join(patch_lines) + "\n"
+    # Slices carry their own newlines; only the diff's final section can
+    # lack one, and git requires the patch to end with a newline.
+    patch_text = "".join(patch_parts)
+    if not patch_text.endswith("\n"):
+        patch_text += "\n"
     return SelectedPatch(
         text=patch_text,
         files=len(selected_files),
@@ -365,26 +442,22 @@ def apply_patch_text(patch_text: str, *, label: str) -> None:
     if not patch_text.strip():
         raise CommandError(f"{label}: patch is empty.")
 
-    with tempfile.NamedTemporaryFile("w", delete=False, prefix="pcs-patch-") as handle:
-        handle.write(patch_text)
-        patch_path = Path(handle.name)
-
-    try:
-        result = git(
-            "apply",
-            "--index",
-            "--3way",
-            "--whitespace=nowarn",
-            str(patch_path),
-            check=False,
+    # Feeding stdin spares a tempfile round-trip through the filesystem for
+    # every changeset application, and there is no path left to unlink.
+    result = git(
+        "apply",
+        "--index",
+        "--3way",
+        "--whitespace=nowarn",
+        "-",
+        input=patch_text,
+        check=False,
+    )
+    if result.returncode != 0:
+        detail = (result.stderr or result.stdout or "").strip()
+        raise CommandError(
+            f"{label}: git apply failed.\n{detail or 'Patch did not apply cleanly.'}"
         )
-        if result.returncode != 0:
-            detail = (result.stderr or result.stdout or "").strip()
-            raise CommandError(
-                f"{label}: git apply failed.\n{detail or 'Patch did not apply cleanly.'}"
-            )
-    finally:
-        patch_path.unlink(missing_ok=True)
 
 
 def resolve_patch_path(patch_file: str) -> Path:
@@ -3,21 +3,21 @@
 
 from __future__ import annotations
 
-import fnmatch
 from pathlib import Path
 from typing import Dict, List, Sequence, Tuple
 
 from common import (
     CommandError,
     checkout_restore,
+    compile_globs,
     compute_freshness,
     delete_branch,
-    diff_name_status,
     ensure_branches_exist,
     ensure_clean_tree,
     ensure_git_repo,
     git,
     repo_root,
+    resolve_objects,
     unique_temp_branch,
 )
 from patch_apply import (
@@ -27,27 +27,21 @@ from patch_apply import (
 )
 
 
-def _changed_paths(base: str, source: str) -> List[str]:
-    raw = diff_name_status(base, source)
+def _changed_paths(diff_files: Sequence) -> List[str]:
+    # The parsed diff already names every touched file, so the changed-path
+    # list costs no extra git process; renames contribute both sides.
     paths: List[str] = []
-    for line in raw.splitlines():
-        parts = line.split("\t")
-        if not parts:
-            continue
-        code = parts[0][:1]
-        if code == "R" and len(parts) >= 3:
-            paths.append(parts[1])
-            paths.append(parts[2])
-        elif len(parts) >= 2:
-            paths.append(parts[1])
+    for df in diff_files:
+        if df.old_path:
+            paths.append(df.old_path)
+        if df.new_path and df.new_path != df.old_path:
+            paths.append(df.new_path)
     return paths
 
 
 def _matches_any(path: str, patterns: Sequence[str]) -> bool:
-    for pattern in patterns:
-        if fnmatch.fnmatch(path, pattern):
-            return True
-    return False
+    compiled = compile_globs(tuple(patterns))
+    return compiled is not None and compiled.match(path) is not None
 
 
 def _warn_placeholders(changeset: Dict, index: int, warnings: List[str]) -> None:
@@ -71,8 +65,7 @@ def _warn_placeholders(changeset: Dict, index: int, warnings: List[str]) -> None
 
 def _validate_paths_mode(
     *,
-    base: str,
-    source: str,
+    changed: Sequence[str],
     changeset: Dict,
     index: int,
     errors: List[str],
@@ -84,7 +77,6 @@ def _validate_paths_mode(
             f"Changeset {index}: include_paths must be non-empty for mode=paths."
         )
         return
-    changed = _changed_paths(base, source)
     matched = []
     for path in changed:
         if _matches_any(path, include) and not _matches_any(path, exclude):
@@ -186,6 +178,10 @@ def validate_plan_strict(plan: Dict) -> Tuple[bool, List[str], List[str]]:
         return False, errors, warnings
 
     diff_files = build_diff(base, source)
+    # The same base..source pair feeds every changeset; derive the changed
+    # paths once from the parsed diff instead of spawning name-status per
+    # paths-mode changeset.
+    changed = _changed_paths(diff_files)
 
     for idx, cs in enumerate(changesets, start=1):
         if not isinstance(cs, dict):
@@ -194,7 +190,7 @@ def validate_plan_strict(plan: Dict) -> Tuple[bool, List[str], List[str]]:
         mode = str(cs.get("mode", "paths")).strip() or "paths"
         if mode == "paths":
             _validate_paths_mode(
-                base=base, source=source, changeset=cs, index=idx, errors=errors
+                changed=changed, changeset=cs, index=idx, errors=errors
             )
         elif mode == "patch":
             _validate_patch_mode(changeset=cs, index=idx, errors=errors)
@@ -245,15 +241,25 @@ def strict_apply_check(plan: Dict) -> None:
 
     ensure_branches_exist([base, source])
 
-    from chain import apply_changeset  # local import to avoid cycles
+    from chain import apply_changeset, changed_files_between  # avoid cycles
 
     temp_branch = unique_temp_branch("pcs-temp-strict-check")
     print(f"[INFO] Creating temporary strict-check branch: {temp_branch}")
 
+    # Snapshot both endpoints once; the whole check then diffs and stages
+    # against immutable SHAs instead of re-resolving refnames per changeset.
+    resolved = resolve_objects([f"{base}^{{commit}}", f"{source}^{{commit}}"])
+    base_sha = resolved[f"{base}^{{commit}}"]
+    source_sha = resolved[f"{source}^{{commit}}"]
+    if base_sha is None or source_sha is None:
+        raise CommandError(f"Unable to resolve {base} or {source} to a commit.")
+
+    diff_entries = changed_files_between(base_sha, source_sha)
+    diff_files = build_diff(base_sha, source_sha)
+
     with checkout_restore() as original:
         try:
             git("checkout", "-B", temp_branch, base)
-            source_sha = git("rev-parse", source).stdout.strip()
             for idx, cs in enumerate(changesets, start=1):
                 print(f"[STEP] Strict-apply changeset {idx}")
                 apply_changeset(
@@ -262,6 +268,9 @@ def strict_apply_check(plan: Dict) -> None:
                     source_sha=source_sha,
                     index=idx,
                     changeset=cs,
+                    base_sha=base_sha,
+                    diff_entries=diff_entries,
+                    diff_files=diff_files,
                 )
         finally:
             git("checkout", original)
@@ -13,11 +13,11 @@ from common import (
     CommandError,
     branch_exists,
     checkout_restore,
+    collect_repo_state,
     compute_freshness,
     delete_branch,
     discover_test_command,
     ensure_clean_tree,
-    ensure_git_repo,
     git,
     is_path_ignored,
     unique_temp_branch,
@@ -89,12 +89,14 @@ def preflight(
     allow_recordkeeping_tracked: bool = False,
 ) -> None:
     effective_test_argv = validate_optional_argv(test_argv, label="approved test argv")
-    ensure_git_repo()
-    ensure_clean_tree()
+    # One repo-state snapshot covers the repo, cleanliness, and both branch
+    # checks that previously each spawned their own git process.
+    state = collect_repo_state()
+    ensure_clean_tree(state)
 
-    if not branch_exists(base):
+    if base not in state.branches and not branch_exists(base):
         raise CommandError(f"Base branch does not exist: {base}")
-    if not branch_exists(source):
+    if source not in state.branches and not branch_exists(source):
         raise CommandError(f"Source branch does not exist: {source}")
 
     recordkeeping_path = ".carve-changesets/"
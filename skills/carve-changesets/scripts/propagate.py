@@ -9,12 +9,12 @@ from typing import Dict, List
 
 from common import (
     CommandError,
-    branch_exists,
     branch_name_for,
     current_branch,
     ensure_clean_tree,
     ensure_git_repo,
     git,
+    local_branch_names,
 )
 from github import (
     edit_pull_request,
@@ -32,7 +32,10 @@ _TITLE_COUNT_RE = re.compile(r"\s+\([1-9][0-9]* of [1-9][0-9]*\)$")
 
 def _ensure_chain_exists(source: str, total: int) -> List[str]:
     chain = [branch_name_for(source, index) for index in range(1, total + 1)]
-    missing = [branch for branch in chain if not branch_exists(branch)]
+    # One for-each-ref snapshot answers every membership test; per-branch
+    # rev-parse probes would cost a subprocess spawn per changeset.
+    known = local_branch_names()
+    missing = [branch for branch in chain if branch not in known]
     if missing:
         raise CommandError("Missing changeset branches:\n" + "\n".join(missing))
     return chain
@@ -9,7 +9,7 @@ from common import (
     CommandError,
     checkout_restore,
     current_branch,
-    delete_branch,
+    delete_branches,
     ensure_clean_tree,
     ensure_git_repo,
     git,
@@ -431,8 +431,7 @@ def recover_suffix_from_live(
         finally:
             if current_branch() != original:
                 git("checkout", original)
-            for temp in temp_branches:
-                delete_branch(temp)
+            delete_branches(temp_branches)
 
     if dry_run:
         print(
@@ -16,6 +16,7 @@ from common import (
     ensure_git_repo,
     git,
     load_plan,
+    local_branch_names,
     merge_base,
     squashed_branch_name,
 )
@@ -50,13 +51,17 @@ def create_squashed_ref(
     ensure_git_repo()
     ensure_clean_tree()
 
-    if not branch_exists(base):
+    # One for-each-ref snapshot answers the common all-local case; base and
+    # source may also be remote-tracking refs, tags, or SHAs, so anything not
+    # in the snapshot still gets the single-ref rev-parse probe.
+    branches = local_branch_names()
+    if base not in branches and not branch_exists(base):
         raise CommandError(f"Base branch does not exist: {base}")
-    if not branch_exists(source):
+    if source not in branches and not branch_exists(source):
         raise CommandError(f"Source branch does not exist: {source}")
 
     squashed = squashed_branch_name(source)
-    exists = branch_exists(squashed)
+    exists = squashed in branches
 
     if exists and not (reuse_existing or recreate):
         raise CommandError(
@@ -72,8 +77,9 @@ def create_squashed_ref(
     if exists and recreate:
         print(f"[STEP] Deleting existing squashed reference: {squashed}")
         delete_branch(squashed)
+        exists = False
 
-    if branch_exists(squashed) and reuse_existing:
+    if exists and reuse_existing:
         print(f"[OK] Reusing existing squashed reference: {squashed}")
         print("[NOTE] Keep this branch local-only. Do not push it.")
         return squashed
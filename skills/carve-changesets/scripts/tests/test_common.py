@@ -6,7 +6,41 @@ import unittest
 from pathlib import Path
 
 import helpers  # noqa: F401  # ensures sys.path is set
-from common import DEFAULT_PLAN_PATH, CommandError, init_plan, load_plan, validate_plan
+from common import (
+    DEFAULT_PLAN_PATH,
+    CommandError,
+    compile_globs,
+    init_plan,
+    load_plan,
+    validate_plan,
+)
+
+
+class GlobTests(unittest.TestCase):
+    def assertGlob(self, pattern: str, path: str, expected: bool) -> None:
+        matched = compile_globs((pattern,)).match(path) is not None
+        self.assertEqual(expected, matched, f"{pattern!r} vs {path!r}")
+
+    def test_double_star_crosses_directories(self) -> None:
+        self.assertGlob("src/**/*.py", "src/a/b/c.py", True)
+        self.assertGlob("src/**/*.py", "src/c.py", True)
+        self.assertGlob("src/**", "src/a/b.py", True)
+        self.assertGlob("src/**/*.py", "other/c.py", False)
+
+    def test_single_star_stays_in_one_segment(self) -> None:
+        self.assertGlob("src/*.py", "src/b.py", True)
+        self.assertGlob("src/*.py", "src/a/b.py", False)
+        self.assertGlob("a?c", "abc", True)
+        self.assertGlob("a?c", "a/c", False)
+
+    def test_literal_and_class_patterns(self) -> None:
+        self.assertGlob("a.txt", "a.txt", True)
+        self.assertGlob("a.txt", "b.txt", False)
+        self.assertGlob("[!ab].txt", "c.txt", True)
+        self.assertGlob("[!ab].txt", "a.txt", False)
+
+    def test_empty_pattern_tuple_compiles_to_none(self) -> None:
+        self.assertIsNone(compile_globs(()))
 
 
 class CommonTests(unittest.TestCase):
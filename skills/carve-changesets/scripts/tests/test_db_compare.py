@@ -53,7 +53,7 @@ class DbCompareTests(unittest.TestCase):
         self,
     ) -> None:
         invalid_values = ["x", ("python3",), {"python3": "-V"}]
-        with patch.object(db_compare_mod, "ensure_git_repo") as ensure_git_repo:
+        with patch.object(db_compare_mod, "collect_repo_state") as collect_repo_state:
             for value in invalid_values:
                 with self.subTest(value=value, boundary="source"):
                     with self.assertRaises(db_compare_mod.CommandError):
@@ -69,19 +69,25 @@ class DbCompareTests(unittest.TestCase):
                             source_argv=["true"],
                             chain_argv=value,
                         )
-            ensure_git_repo.assert_not_called()
+            collect_repo_state.assert_not_called()
 
     def test_run_capture_preserves_exact_argv_and_restricts_output(self) -> None:
         exact_argv = ["python3", "-c", "print('two words')", "literal $VALUE"]
+
+        def fake_execute(argv, *, text, stdout, stderr):
+            stdout.write(b"payload\n")
+            return subprocess.CompletedProcess(argv, 0, None, "")
+
         with tempfile.TemporaryDirectory() as directory:
             outfile = Path(directory) / "source.txt"
-            completed = subprocess.CompletedProcess(exact_argv, 0, "payload\n", "")
             with patch.object(
-                db_compare_mod, "execute_argv", return_value=completed
+                db_compare_mod, "execute_argv", side_effect=fake_execute
             ) as execute:
                 db_compare_mod.run_capture(exact_argv, outfile)
 
-            execute.assert_called_once_with(exact_argv, text=True, capture_output=True)
+            self.assertEqual((exact_argv,), execute.call_args.args)
+            self.assertTrue(execute.call_args.kwargs["text"])
+            self.assertIs(subprocess.PIPE, execute.call_args.kwargs["stderr"])
             self.assertEqual("payload\n", outfile.read_text())
             self.assertEqual(0o600, stat.S_IMODE(outfile.stat().st_mode))
 
@@ -169,22 +175,18 @@ class DbCompareTests(unittest.TestCase):
 
     def test_diff_failure_removes_ephemeral_outputs(self) -> None:
         repo_dir, plan = self._prepare_repo()
-        original_git = db_compare_mod.git
-
-        def fail_diff(*args, **kwargs):
-            if args[:2] == ("diff", "--no-index"):
-                return subprocess.CompletedProcess(args, 2, "", "diff failed")
-            return original_git(*args, **kwargs)
-
         try:
             with (
                 chdir(repo_dir),
                 self._record_ephemeral_directory() as ephemeral_paths,
-                patch.object(db_compare_mod, "git", side_effect=fail_diff),
+                patch.object(
+                    db_compare_mod,
+                    "compare_outputs",
+                    side_effect=db_compare_mod.CommandError("diff failed"),
+                ),
             ):
                 with self.assertRaisesRegex(
-                    db_compare_mod.CommandError,
-                    r"(?s)Database output comparison failed \(2\).*diff failed",
+                    db_compare_mod.CommandError, "diff failed"
                 ):
                     db_compare_mod.db_compare(
                         plan,
@@ -193,7 +193,11 @@ class ForwardEvaluationTests(unittest.TestCase):
         try:
             rc = RUNNER.main(["--output-dir", str(output_dir)])
             self.assertEqual(0, rc)
-            self.assertEqual(len(self.cases), len(list(output_dir.glob("*.json"))))
+            written = sorted(path.name for path in output_dir.glob("*.json"))
+            self.assertEqual(["summary.json"], written)
+            summary = json.loads((output_dir / "summary.json").read_text())
+            self.assertEqual(len(self.cases), summary["total"])
+            self.assertEqual(0, summary["failed"])
         finally:
             shutil.rmtree(output_dir)
 
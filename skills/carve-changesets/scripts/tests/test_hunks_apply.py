@@ -8,6 +8,7 @@ from pathlib import Path
 import legacy_helpers as helpers
 from chain import compare_chain, create_chain
 from common import CommandError
+from patch_apply import build_diff_for_path
 from plan_checks import strict_apply_check, validate_plan_strict
 
 
@@ -370,6 +371,21 @@ class HunkApplyTests(unittest.TestCase):
         finally:
             shutil.rmtree(repo_dir)
 
+    def test_build_diff_for_path_resolves_rename_sides(self) -> None:
+        repo_dir, _plan = _init_rename_repo()
+        try:
+            with helpers.chdir(repo_dir):
+                # Either side of the rename must yield the rename entry, not
+                # a bare deletion or addition from a one-sided pathspec.
+                for lookup in ("old.txt", "new.txt"):
+                    files = build_diff_for_path("main", "feature/rename", lookup)
+                    self.assertEqual(len(files), 1, lookup)
+                    self.assertEqual(files[0].old_path, "old.txt")
+                    self.assertEqual(files[0].new_path, "new.txt")
+                    self.assertEqual(len(files[0].hunks), 1)
+        finally:
+            shutil.rmtree(repo_dir)
+
     def test_hunks_with_rename_scope_exclude_either_path(self) -> None:
         repo_dir, plan = _init_rename_repo()
         try:
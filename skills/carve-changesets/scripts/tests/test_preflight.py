@@ -12,7 +12,7 @@ from legacy_helpers import chdir, commit, init_conflict_repo, init_repo, run
 class PreflightTests(unittest.TestCase):
     def test_preflight_rejects_unknown_command_representations_before_git(self) -> None:
         invalid_values = ["x", ("python3",), {"python3": "-V"}]
-        with patch.object(preflight_mod, "ensure_git_repo") as ensure_git_repo:
+        with patch.object(preflight_mod, "collect_repo_state") as collect_repo_state:
             for value in invalid_values:
                 with self.subTest(value=value):
                     with self.assertRaises(CommandError):
@@ -23,7 +23,7 @@ class PreflightTests(unittest.TestCase):
                             skip_tests=False,
                             skip_merge_check=False,
                         )
-            ensure_git_repo.assert_not_called()
+            collect_repo_state.assert_not_called()
 
     def test_preflight_success_does_not_modify_source(self) -> None:
         repo_dir, plan = init_repo()